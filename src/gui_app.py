@@ -1,16 +1,50 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, font
+from tkinter import ttk
 import threading
-import json
+import functools
 import os
+import queue
+import re
+import sys
 import time
+from collections import OrderedDict, deque
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List
-from log_filter import LogFilterWindow
-from update_checker import UpdateChecker
 
 # Removed: from filter_keywords_history import FilterKeywordsHistory, FilterKeywordsHistoryWindow
 
+# 可选依赖：安装orjson时用其序列化配置（比标准库json快数倍），否则回退到json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 预设和批量配置总条数超过此值时以紧凑格式保存（缩进输出是序列化中最慢的部分）
+CONFIG_INDENT_MAX_ITEMS = 50
+
+
+def _dumps_config(config, indent: bool = True) -> bytes:
+    """序列化配置为UTF-8字节（indent为False时输出紧凑格式）"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 if indent else None)
+    import json
+
+    if indent:
+        return json.dumps(config, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(config, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_config(data: bytes):
+    """解析配置文件内容"""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data.decode("utf-8"))
+
+
 # 延迟导入serial_monitor以加快启动
 _monitor_module = None
 
@@ -26,32 +60,227 @@ def get_monitor_module():
 
 
 # 读取版本信息 - 优化：缓存版本号
-_version_cache = None
-_build_time_cache = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_version_info() -> tuple:
     """从VERSION文件读取版本号和编译时间（带缓存）"""
-    global _version_cache, _build_time_cache
-    if _version_cache is not None:
-        return _version_cache, _build_time_cache
-
     try:
-        version_file = Path(__file__).parent / "VERSION"
-        if version_file.exists():
-            content = version_file.read_text(encoding="utf-8").strip()
-            lines = content.split("\n")
-            _version_cache = lines[0].strip()
-            _build_time_cache = lines[1].strip() if len(lines) > 1 else None
-            return _version_cache, _build_time_cache
+        version_file = Path(__file__).with_name("VERSION")
+        if version_file.is_file():
+            lines = version_file.read_text(encoding="utf-8").strip().split("\n")
+            return lines[0].strip(), lines[1].strip() if len(lines) > 1 else None
     except Exception:
         pass
-    _version_cache = "1.0.0"
-    _build_time_cache = None
-    return _version_cache, _build_time_cache
-
-
-VERSION, BUILD_TIME = get_version_info()
+    return "1.0.0", None
+
+
+# 过滤条件分隔符：逗号及其两侧空白，一次完成分割和去空白
+_FILTER_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# 乱码检测用：删除可打印ASCII字符及\t\n\r，只留下需要逐个判断的字符
+_PRINTABLE_ASCII_TABLE = dict.fromkeys([*range(0x20, 0x7F), 0x09, 0x0A, 0x0D])
+
+# 端口颜色名称（对应主题配色中的port_colors），按首次出现顺序轮流分配
+PORT_COLOR_NAMES = (
+    "BRIGHT_BLUE",
+    "BRIGHT_GREEN",
+    "BRIGHT_CYAN",
+    "BRIGHT_MAGENTA",
+    "BRIGHT_YELLOW",
+    "BRIGHT_RED",
+    "BLUE",
+    "GREEN",
+    "CYAN",
+    "MAGENTA",
+)
+
+# 端口颜色标签池名称，预先生成并驻留，分配标签时不再格式化字符串
+PORT_COLOR_TAGS = tuple(
+    sys.intern(f"port_color_{index}") for index in range(len(PORT_COLOR_NAMES))
+)
+
+
+# 主题配色 - 模块级只读常量，切换主题时直接引用，无需每次重建字典
+# 浅色主题 - 现代清新护眼设计
+LIGHT_THEME = MappingProxyType(
+    {
+        "bg": "#f8f9fa",
+        "panel_bg": "#ffffff",
+        "field_bg": "#ffffff",
+        "label_fg": "#495057",
+        "button_bg": "#007bff",
+        "button_active": "#0056b3",
+        "button_pressed": "#004085",
+        "text_bg": "#ffffff",
+        "text_fg": "#212529",
+        "stats_bg": "#e9ecef",
+        "stats_fg": "#495057",
+        "status_bg": "#ffffff",
+        "status_fg": "#28a745",
+        "version_fg": "#6c757d",
+        "timestamp": "#6c757d",
+        "default": "#212529",
+        "error": "#dc3545",
+        "warning": "#ffc107",
+        "success": "#28a745",
+        "port_colors": MappingProxyType(
+            {
+                "BRIGHT_BLUE": "#007bff",
+                "BRIGHT_GREEN": "#28a745",
+                "BRIGHT_CYAN": "#17a2b8",
+                "BRIGHT_MAGENTA": "#6f42c1",
+                "BRIGHT_YELLOW": "#fd7e14",
+                "BRIGHT_RED": "#dc3545",
+                "BLUE": "#0056b3",
+                "GREEN": "#218838",
+                "CYAN": "#138496",
+                "MAGENTA": "#5a32a3",
+            }
+        ),
+        "stats_port": "#007bff",
+        "stats_bytes": "#28a745",
+        "stats_separator": "#6c757d",
+        "start_button_bg": "#28a745",
+        "start_button_hover": "#218838",
+        "stop_button_bg": "#dc3545",
+        "stop_button_hover": "#c82333",
+        "batch_start_bg": "#ff6b00",  # 亮橙色
+        "batch_start_hover": "#e55a00",
+    }
+)
+
+# 深色主题 - 现代深色设计
+DARK_THEME = MappingProxyType(
+    {
+        "bg": "#1e1e1e",
+        "panel_bg": "#2d2d2d",
+        "field_bg": "#2d2d2d",
+        "label_fg": "#d4d4d4",
+        "button_bg": "#0e639c",
+        "button_active": "#1177bb",
+        "button_pressed": "#1e88cf",
+        "text_bg": "#2d2d2d",
+        "text_fg": "#d4d4d4",
+        "stats_bg": "#252526",
+        "stats_fg": "#cccccc",
+        "status_bg": "#2d2d2d",
+        "status_fg": "#4ec9b0",
+        "version_fg": "#858585",
+        "timestamp": "#858585",
+        "default": "#d4d4d4",
+        "error": "#f48771",
+        "warning": "#dcdcaa",
+        "success": "#4ec9b0",
+        "port_colors": MappingProxyType(
+            {
+                "BRIGHT_BLUE": "#569cd6",
+                "BRIGHT_GREEN": "#4ec9b0",
+                "BRIGHT_CYAN": "#4fc1ff",
+                "BRIGHT_MAGENTA": "#c586c0",
+                "BRIGHT_YELLOW": "#dcdcaa",
+                "BRIGHT_RED": "#f48771",
+                "BLUE": "#3f8dd6",
+                "GREEN": "#3fa9a0",
+                "CYAN": "#3fb1ef",
+                "MAGENTA": "#b576b0",
+            }
+        ),
+        "stats_port": "#569cd6",
+        "stats_bytes": "#4ec9b0",
+        "stats_separator": "#858585",
+        "start_button_bg": "#4ec9b0",
+        "start_button_hover": "#3fa9a0",
+        "stop_button_bg": "#f48771",
+        "stop_button_hover": "#e67761",
+        "batch_start_bg": "#ff8c00",  # 橙色
+        "batch_start_hover": "#ff7700",
+    }
+)
+
+_BUTTON_PADDING = (15, 8)  # 统一内边距
+# 界面字体（各处共用同一组字体描述）
+_UI_FONT_FAMILY = "Microsoft YaHei UI"
+_FONT_UI_8 = (_UI_FONT_FAMILY, 8)
+_FONT_UI_9 = (_UI_FONT_FAMILY, 9)
+_FONT_UI_9_BOLD = (_UI_FONT_FAMILY, 9, "bold")
+_FONT_UI_10 = (_UI_FONT_FAMILY, 10)
+_FONT_UI_10_BOLD = (_UI_FONT_FAMILY, 10, "bold")
+_FONT_UI_11_BOLD = (_UI_FONT_FAMILY, 11, "bold")
+_FONT_MONO_9 = ("Consolas", 9)
+_FONT_MONO_10_BOLD = ("Consolas", 10, "bold")
+_FONT_MONO_11 = ("Consolas", 11)
+_FONT_EMOJI_10 = ("Segoe UI Emoji", 10)
+_FONT_EMOJI_14 = ("Segoe UI Emoji", 14)
+
+_BUTTON_FONT = _FONT_UI_10_BOLD  # 统一字体
+
+# ttk样式表：(样式名, {选项: 配色键}, 固定选项)
+_THEME_STYLES = (
+    ("TFrame", {"background": "bg"}, {}),
+    ("TLabelframe", {"background": "panel_bg"}, {"borderwidth": 1, "relief": "solid"}),
+    (
+        "TLabelframe.Label",
+        {"background": "panel_bg", "foreground": "label_fg"},
+        {"font": _FONT_UI_11_BOLD},
+    ),
+    (
+        "TButton",
+        {"background": "button_bg"},
+        {
+            "foreground": "#ffffff",
+            "borderwidth": 0,
+            "focuscolor": "none",
+            "font": _BUTTON_FONT,
+            "padding": _BUTTON_PADDING,
+        },
+    ),
+    (
+        "TCombobox",
+        {
+            "fieldbackground": "field_bg",
+            "background": "field_bg",
+            "foreground": "label_fg",
+        },
+        {"borderwidth": 1, "relief": "solid"},
+    ),
+    (
+        "TLabel",
+        {"background": "bg", "foreground": "label_fg"},
+        {"font": _FONT_UI_10},
+    ),
+    (
+        "TEntry",
+        {"fieldbackground": "field_bg", "foreground": "label_fg"},
+        {"borderwidth": 1, "relief": "solid"},
+    ),
+    (
+        "Small.TButton",
+        {"background": "button_bg"},
+        {
+            "foreground": "#ffffff",
+            "borderwidth": 0,
+            "focuscolor": "none",
+            "font": _FONT_UI_9,
+            "padding": _BUTTON_PADDING,
+        },
+    ),
+    (
+        "Theme.TButton",
+        {"background": "panel_bg", "foreground": "label_fg"},
+        {
+            "borderwidth": 1,
+            "relief": "flat",
+            "font": _FONT_EMOJI_14,
+            "padding": (8, 4),
+        },
+    ),
+)
+
+# 彩色操作按钮：(样式名, 背景配色键, 悬停配色键)
+_ACTION_BUTTON_STYLES = (
+    ("Start.TButton", "start_button_bg", "start_button_hover"),
+    ("Stop.TButton", "stop_button_bg", "stop_button_hover"),
+    ("BatchStart.TButton", "batch_start_bg", "batch_start_hover"),
+)
 
 
 class SerialToolGUI:
@@ -59,7 +288,9 @@ class SerialToolGUI:
 
     def __init__(self, root):
         self.root = root
-        self.root.title(f"多串口监控工具 v{VERSION}")
+        # 版本号在创建窗口时才读取（带缓存），导入模块时不访问文件系统
+        version, _ = get_version_info()
+        self.root.title(f"多串口监控工具 v{version}")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 800)
 
@@ -69,36 +300,96 @@ class SerialToolGUI:
         # 高级工具区折叠状态
         self.tools_expanded = False
 
-        # 配置现代化主题
+        # 配置现代化主题（记录已应用的样式选项，切换时只推送变化部分）
+        self._last_style_snapshot = {}
         self._configure_modern_theme()
 
         # 设置默认全屏
         self.root.state("zoomed")
 
-        # 延迟初始化monitor
-        monitor_mod = get_monitor_module()
-        self.monitor = monitor_mod["MultiSerialMonitor"](log_dir="logs")
+        # 延迟初始化monitor：首屏显示后在_delayed_init中创建（见monitor属性）
+        self._monitor = None
+        # 更新检查器同样延迟到首次检查更新时创建（见update_checker属性）
+        self._update_checker = None
         self.port_configs: Dict[str, Dict] = {}
         self.config_file = "serial_tool_config.json"  # 统一配置文件
+        self._config_write_lock = threading.Lock()  # 串行化后台写盘
+        self._config_write_queue = queue.Queue(maxsize=1)  # 待写入的最新配置
+        self._config_writer = None  # 后台写盘线程（首次保存时启动）
+        self._config_save_seq = 0  # 保存请求序号，写盘线程据此丢弃过期数据
+        self._last_config_bytes = None  # 已成功写入文件的配置内容，未变化时跳过写盘
         self.batch_port_configs: List[Dict] = []  # 批量串口配置列表
         self.preset_data_list: List[Dict] = []  # 预设数据列表
+        # 按串口名/预设名索引同一批字典，查找时不必遍历列表（列表保留顺序用于保存和显示）
+        self._batch_by_port: Dict[str, Dict] = {}
+        self._preset_by_name: Dict[str, Dict] = {}
 
         # 性能优化：批量更新缓冲区 - 激进的实时显示策略
-        self.display_buffer = []
-        self.buffer_lock = threading.Lock()
-        self.max_buffer_size = 100  # 批量处理的最大条目数
-        self.update_interval = 16  # UI更新间隔(毫秒) - 约60fps，减少CPU压力
-        self.batch_threshold = 50  # 超过此值才批量处理
+        # 有界环形缓冲区：UI跟不上时自动丢弃最旧的数据，避免内存无限增长
+        # deque的append/popleft本身是线程安全的，串口线程写入无需额外加锁
+        self.max_pending_lines = 10000
+        self.display_buffer = deque(maxlen=self.max_pending_lines)
+        self._dropped_lines = 0  # 因缓冲区已满而被丢弃的行数
+        self.max_buffer_size = 100  # 每次刷新从缓冲区取出的最大条目数
+        self.update_interval = 16  # 当前UI更新间隔(毫秒)，根据负载自适应调整
+        self.min_update_interval = 16  # 最短间隔 - 约60fps，持续高负载时使用
+        self.max_update_interval = 50  # 最长间隔 - 空闲时降低轮询频率
+        self.target_fill = 10  # 期望每次刷新时缓冲区中的条目数
+        self._ema_fill = 0.0  # 缓冲区填充量的指数移动平均
+        self._work_time_ema = 0.0  # 每次刷新耗时(秒)的指数移动平均
+        # 显示行数上限：超过max_display_lines时一次删到trim_to_lines，
+        # 两者之差使删除操作每隔约200行才发生一次
         self.max_display_lines = 1000  # 最大显示行数
         self.trim_to_lines = 800  # 超过最大行数时保留的行数
-        self.last_trim_time = 0  # 上次清理时间
-        self.trim_interval = 10.0  # 清理间隔(秒)（减少清理频率）
+        self._line_count = 0  # 显示区中的完整行数（每条数据恰好一行，随插入累加）
+        self.autoscroll_every = 4  # 每隔多少次刷新才滚动一次到底部
+        self._flush_count = 0  # 已处理的非空批次数
+        self._autoscroll_pending = False  # 是否有待执行的自动滚动
+        self._autoscroll_anchor = None  # 记下待滚动时可见区域首行，变化说明用户滚动过
+        self._insert_args = []  # 批量insert参数列表，每次刷新时复用
+
+        # 配置保存合并：连续修改时每个时间窗口最多写一次文件
+        self.config_save_delay = 500  # 毫秒
+        self._save_after_id = None
+        self._config_dirty = False  # 是否有尚未保存的修改
+        self._loading = False  # 加载配置期间为True，修改只做标记，加载完成后再保存
+        self._changed_while_loading = set()  # 加载期间被用户修改的Tk变量名
+
+        # 过滤条件解析缓存：输入文本未变化时直接复用上次结果
+        self._filter_cache_source = None
+        self._filter_cache = ()
+        self._compiled_filter_source = None
+        self._compiled_filters = ()
+        # 单个正则的编译缓存：修改其中一条时其余正则无需重新编译
+        self._regex_cache: Dict[str, re.Pattern] = {}
+        self.max_regex_cache_size = 256
 
         # 数据统计更新
         self.stats_update_interval = 2000  # 统计信息更新间隔(毫秒)（降低更新频率）
+        self.hidden_stats_interval = 10000  # 窗口隐藏时的统计轮询间隔(毫秒)
+        self._stats_after_id = None
+
+        # 窗口可见状态：由<Map>/<Unmap>事件维护，隐藏时暂停界面刷新
+        self._window_visible = True
+        self.hidden_poll_interval = 500  # 隐藏期间的轮询间隔(毫秒)
+        self._display_after_id = None
+
+        # 可能尚未创建的组件先置为None，更新颜色/加载配置时据此判断
+        self.left_canvas = None
+        self.theme_toggle_btn = None
+        self.status_frame = None
+        self.status_bar = None
+        self.version_label = None
+        self.tools_toggle_btn = None
+        self.tools_content = None
 
         self._create_widgets()
-        self._load_config()
+        # 其余界面组件在空闲时逐组创建，窗口先完成首次绘制
+        self.root.after_idle(self._pump_widget_builders)
+        # 配置文件在首帧绘制后再读取，避免磁盘I/O推迟窗口显示
+        self.root.after_idle(self._load_config)
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.root.bind("<Unmap>", self._on_root_unmap, add="+")
         self._start_ui_update_loop()
 
         # 优化：延迟启动非关键任务
@@ -106,325 +397,149 @@ class SerialToolGUI:
 
     def _configure_modern_theme(self):
         """配置现代化主题样式 - 支持深浅切换"""
-        if self.is_dark_theme:
-            self._apply_dark_theme()
-        else:
-            self._apply_light_theme()
-
-        # 配置专用按钮样式
-        self._configure_special_button_styles()
-
-    def _apply_light_theme(self):
-        """应用浅色主题 - 现代清新护眼设计"""
-        # 设置清新的背景色
-        self.root.configure(bg="#f8f9fa")
+        self.theme_colors = colors = DARK_THEME if self.is_dark_theme else LIGHT_THEME
+        self.root.configure(bg=colors["bg"])
 
-        # 配置ttk样式
         style = ttk.Style()
-        style.theme_use("clam")
+        if style.theme_use() != "clam":
+            style.theme_use("clam")
 
-        # 配置Frame样式 - 现代简洁
-        style.configure("TFrame", background="#f8f9fa")
-        style.configure(
-            "TLabelframe", background="#ffffff", borderwidth=1, relief="solid"
-        )
-        style.configure(
-            "TLabelframe.Label",
-            background="#ffffff",
-            foreground="#495057",
-            font=("Microsoft YaHei UI", 11, "bold"),
-        )
+        for name, color_options, options in _THEME_STYLES:
+            themed = {option: colors[key] for option, key in color_options.items()}
+            self._configure_style(style, name, {**options, **themed})
 
-        # 配置Button样式 - 现代蓝色调，统一大小
-        style.configure(
-            "TButton",
-            background="#007bff",
-            foreground="#ffffff",
-            borderwidth=0,
-            focuscolor="none",
-            font=("Microsoft YaHei UI", 10, "bold"),
-            padding=(15, 8),  # 统一内边距
-        )
-        style.map(
+        self._map_style(
+            style,
             "TButton",
-            background=[("active", "#0056b3"), ("pressed", "#004085")],
+            background=[
+                ("active", colors["button_active"]),
+                ("pressed", colors["button_pressed"]),
+            ],
             foreground=[("active", "#ffffff"), ("pressed", "#ffffff")],
         )
-
-        # 配置Combobox样式 - 现代边框
-        style.configure(
-            "TCombobox",
-            fieldbackground="#ffffff",
-            background="#ffffff",
-            foreground="#495057",
-            borderwidth=1,
-            relief="solid",
-        )
-        style.map("TCombobox", foreground=[("readonly", "#495057")])
-
-        # 配置Label样式 - 清晰文字
-        style.configure(
-            "TLabel",
-            background="#f8f9fa",
-            foreground="#495057",
-            font=("Microsoft YaHei UI", 10),
+        self._map_style(
+            style, "TCombobox", foreground=[("readonly", colors["label_fg"])]
         )
 
-        # 配置Entry样式 - 现代边框
-        style.configure(
-            "TEntry",
-            fieldbackground="#ffffff",
-            foreground="#495057",
-            borderwidth=1,
-            relief="solid",
-        )
-
-        # 存储浅色主题配色 - 现代清新
-        self.theme_colors = {
-            "bg": "#f8f9fa",
-            "text_bg": "#ffffff",
-            "text_fg": "#212529",
-            "stats_bg": "#e9ecef",
-            "stats_fg": "#495057",
-            "status_bg": "#ffffff",
-            "status_fg": "#28a745",
-            "version_fg": "#6c757d",
-            "timestamp": "#6c757d",
-            "default": "#212529",
-            "error": "#dc3545",
-            "warning": "#ffc107",
-            "success": "#28a745",
-            "port_colors": {
-                "BRIGHT_BLUE": "#007bff",
-                "BRIGHT_GREEN": "#28a745",
-                "BRIGHT_CYAN": "#17a2b8",
-                "BRIGHT_MAGENTA": "#6f42c1",
-                "BRIGHT_YELLOW": "#fd7e14",
-                "BRIGHT_RED": "#dc3545",
-                "BLUE": "#0056b3",
-                "GREEN": "#218838",
-                "CYAN": "#138496",
-                "MAGENTA": "#5a32a3",
-            },
-            "stats_port": "#007bff",
-            "stats_bytes": "#28a745",
-            "stats_separator": "#6c757d",
-            "start_button_bg": "#28a745",
-            "start_button_hover": "#218838",
-            "stop_button_bg": "#dc3545",
-            "stop_button_hover": "#c82333",
-        }
-
-    def _apply_dark_theme(self):
-        """应用深色主题 - 现代深色设计"""
-        # 设置现代深色背景
-        self.root.configure(bg="#1e1e1e")
-
-        # 配置ttk样式
-        style = ttk.Style()
-        style.theme_use("clam")
-
-        # 配置Frame样式 - 现代深色
-        style.configure("TFrame", background="#1e1e1e")
-        style.configure(
-            "TLabelframe", background="#2d2d2d", borderwidth=1, relief="solid"
-        )
-        style.configure(
-            "TLabelframe.Label",
-            background="#2d2d2d",
-            foreground="#d4d4d4",
-            font=("Microsoft YaHei UI", 11, "bold"),
-        )
-
-        # 配置Button样式 - 现代蓝色调，统一大小
-        style.configure(
-            "TButton",
-            background="#0e639c",
-            foreground="#ffffff",
-            borderwidth=0,
-            focuscolor="none",
-            font=("Microsoft YaHei UI", 10, "bold"),
-            padding=(15, 8),  # 统一内边距
-        )
-        style.map(
-            "TButton",
-            background=[("active", "#1177bb"), ("pressed", "#1e88cf")],
-            foreground=[("active", "#ffffff"), ("pressed", "#ffffff")],
-        )
-
-        # 配置Combobox样式 - 现代深色
-        style.configure(
-            "TCombobox",
-            fieldbackground="#2d2d2d",
-            background="#2d2d2d",
-            foreground="#d4d4d4",
-            borderwidth=1,
-            relief="solid",
-        )
-        style.map("TCombobox", foreground=[("readonly", "#d4d4d4")])
-
-        # 配置Label样式 - 现代深色
-        style.configure(
-            "TLabel",
-            background="#1e1e1e",
-            foreground="#d4d4d4",
-            font=("Microsoft YaHei UI", 10),
-        )
-
-        # 配置Entry样式 - 现代深色
-        style.configure(
-            "TEntry",
-            fieldbackground="#2d2d2d",
-            foreground="#d4d4d4",
-            borderwidth=1,
-            relief="solid",
-        )
-
-        # 存储深色主题配色 - 现代深色
-        self.theme_colors = {
-            "bg": "#1e1e1e",
-            "text_bg": "#2d2d2d",
-            "text_fg": "#d4d4d4",
-            "stats_bg": "#252526",
-            "stats_fg": "#cccccc",
-            "status_bg": "#2d2d2d",
-            "status_fg": "#4ec9b0",
-            "version_fg": "#858585",
-            "timestamp": "#858585",
-            "default": "#d4d4d4",
-            "error": "#f48771",
-            "warning": "#dcdcaa",
-            "success": "#4ec9b0",
-            "port_colors": {
-                "BRIGHT_BLUE": "#569cd6",
-                "BRIGHT_GREEN": "#4ec9b0",
-                "BRIGHT_CYAN": "#4fc1ff",
-                "BRIGHT_MAGENTA": "#c586c0",
-                "BRIGHT_YELLOW": "#dcdcaa",
-                "BRIGHT_RED": "#f48771",
-                "BLUE": "#3f8dd6",
-                "GREEN": "#3fa9a0",
-                "CYAN": "#3fb1ef",
-                "MAGENTA": "#b576b0",
-            },
-            "stats_port": "#569cd6",
-            "stats_bytes": "#4ec9b0",
-            "stats_separator": "#858585",
-            "start_button_bg": "#4ec9b0",
-            "start_button_hover": "#3fa9a0",
-            "stop_button_bg": "#f48771",
-            "stop_button_hover": "#e67761",
-        }
-
-    def _configure_special_button_styles(self):
-        """配置专用按钮样式"""
-        style = ttk.Style()
-
-        # 统一的按钮padding和字体
-        uniform_padding = (15, 8)  # 统一内边距
-        uniform_font = ("Microsoft YaHei UI", 10, "bold")  # 统一字体
-
-        # 启动按钮样式 - 绿色
-        if self.is_dark_theme:
-            start_bg = "#4ec9b0"
-            start_hover = "#3fa9a0"
-        else:
-            start_bg = "#28a745"
-            start_hover = "#218838"
+        # 配置专用按钮样式
+        for name, bg_key, hover_key in _ACTION_BUTTON_STYLES:
+            self._configure_style(
+                style,
+                name,
+                {
+                    "background": colors[bg_key],
+                    "foreground": "#ffffff",
+                    "borderwidth": 0,
+                    "focuscolor": "none",
+                    "font": _BUTTON_FONT,
+                    "padding": _BUTTON_PADDING,
+                },
+            )
+            hover = colors[hover_key]
+            self._map_style(
+                style, name, background=[("active", hover), ("pressed", hover)]
+            )
 
-        style.configure(
-            "Start.TButton",
-            background=start_bg,
-            foreground="#ffffff",
-            borderwidth=0,
-            focuscolor="none",
-            font=uniform_font,
-            padding=uniform_padding,
-        )
-        style.map(
-            "Start.TButton",
-            background=[("active", start_hover), ("pressed", start_hover)],
-        )
+    def _configure_style(self, style, name, options):
+        """只把与上次不同的样式选项发送给Tk，切换主题时省去未变化的选项"""
+        last = self._last_style_snapshot.setdefault(name, {})
+        delta = {k: v for k, v in options.items() if last.get(k) != v}
+        if delta:
+            style.configure(name, **delta)
+            last.update(delta)
+
+    def _map_style(self, style, name, **state_options):
+        """只在状态映射变化时调用style.map"""
+        key = (name, "map")
+        if self._last_style_snapshot.get(key) != state_options:
+            style.map(name, **state_options)
+            self._last_style_snapshot[key] = state_options
+
+    @property
+    def monitor(self):
+        """串口监控管理器，首次访问时才导入serial_monitor(pyserial)并创建"""
+        if self._monitor is None:
+            monitor_mod = get_monitor_module()
+            self._monitor = monitor_mod["MultiSerialMonitor"](log_dir="logs")
+        return self._monitor
+
+    @property
+    def update_checker(self):
+        """更新检查器，首次检查更新时才导入update_checker(urllib、zipfile)并创建"""
+        if self._update_checker is None:
+            from update_checker import UpdateChecker
+
+            # 初始化更新检查器（用户需要配置自己的GitHub仓库信息）
+            self._update_checker = UpdateChecker(
+                owner="ZubenStar",  # 修改为你的GitHub用户名
+                repo="serial_tool",  # 修改为你的仓库名
+            )
+        return self._update_checker
 
-        # 停止按钮样式 - 红色
-        if self.is_dark_theme:
-            stop_bg = "#f48771"
-            stop_hover = "#e67761"
-        else:
-            stop_bg = "#dc3545"
-            stop_hover = "#c82333"
+    def _delayed_init(self):
+        """延迟初始化非关键组件"""
+        # 串口模块在此处首次用到monitor时才导入（刷新活动列表），不占用首屏绘制时间
+        self._create_info_widgets()
+        self._update_available_ports()
+        self._start_stats_update_loop()
 
-        style.configure(
-            "Stop.TButton",
-            background=stop_bg,
-            foreground="#ffffff",
+    def _create_info_widgets(self):
+        """创建活动串口列表和统计显示控件（首屏显示后再创建）"""
+        self.active_list = tk.Listbox(
+            self.active_frame,
+            height=3,
+            background=self.theme_colors["text_bg"],
+            foreground=self.theme_colors["text_fg"],
+            selectbackground=self.theme_colors["stats_bg"],
+            selectforeground=self.theme_colors["text_fg"],
+            relief=tk.FLAT,
             borderwidth=0,
-            focuscolor="none",
-            font=uniform_font,
-            padding=uniform_padding,
-        )
-        style.map(
-            "Stop.TButton", background=[("active", stop_hover), ("pressed", stop_hover)]
+            highlightthickness=0,
+            font=_FONT_UI_9,
         )
+        self.active_list.pack(fill=tk.BOTH, expand=True)
 
-        # 小型按钮样式 - 用于工具区，统一大小
-        style.configure(
-            "Small.TButton",
-            background="#0e639c" if self.is_dark_theme else "#007bff",
-            foreground="#ffffff",
+        # 使用Text widget来显示统计信息，支持多行 - 柔和样式
+        self.stats_display = tk.Text(
+            self.stats_frame,
+            height=3,
+            wrap=tk.WORD,
+            state=tk.DISABLED,
+            background=self.theme_colors["stats_bg"],
+            foreground=self.theme_colors["stats_fg"],
+            relief=tk.FLAT,
             borderwidth=0,
-            focuscolor="none",
-            font=("Microsoft YaHei UI", 9),
-            padding=uniform_padding,  # 使用统一padding
+            highlightthickness=0,
+            font=_FONT_UI_10,
+            padx=10,
+            pady=5,
         )
-
-        # 主题切换小按钮样式
-        style.configure(
-            "Theme.TButton",
-            background="#2d2d2d" if self.is_dark_theme else "#ffffff",
-            foreground="#d4d4d4" if self.is_dark_theme else "#495057",
-            borderwidth=1,
-            relief="flat",
-            font=("Segoe UI Emoji", 14),
-            padding=(8, 4),
+        self.stats_display.pack(fill=tk.BOTH, expand=True)
+        self.stats_display.tag_config(
+            "port_name",
+            foreground=self.theme_colors["stats_port"],
+            font=_FONT_UI_9_BOLD,
         )
-
-        # 批量启动按钮样式 - 显眼的橙色
-        if self.is_dark_theme:
-            batch_start_bg = "#ff8c00"  # 橙色
-            batch_start_hover = "#ff7700"
-        else:
-            batch_start_bg = "#ff6b00"  # 亮橙色
-            batch_start_hover = "#e55a00"
-
-        style.configure(
-            "BatchStart.TButton",
-            background=batch_start_bg,
-            foreground="#ffffff",
-            borderwidth=0,
-            focuscolor="none",
-            font=uniform_font,
-            padding=uniform_padding,  # 使用统一padding
+        self.stats_display.tag_config(
+            "bytes",
+            foreground=self.theme_colors["stats_bytes"],
+            font=_FONT_UI_9_BOLD,
         )
-        style.map(
-            "BatchStart.TButton",
-            background=[("active", batch_start_hover), ("pressed", batch_start_hover)],
+        self.stats_display.tag_config(
+            "separator", foreground=self.theme_colors["stats_separator"]
         )
 
-    def _delayed_init(self):
-        """延迟初始化非关键组件"""
-        self._update_available_ports()
-        self._start_stats_update_loop()
+        # 创建前已启动的串口（如配置加载后立即启动）补充显示
+        self._update_active_list()
 
     def _create_widgets(self):
         """创建界面组件 - 可拖动调整的左右布局，带滚动条"""
+        from tkinter import scrolledtext
+
         # 创建主容器框架
         main_container = ttk.Frame(self.root)
         main_container.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
 
-        # 优化：使用after延迟初始化统计显示，减少启动时间
-        self._stats_display_created = False
-
         # 创建可拖动的PanedWindow - 水平方向
         self.paned_window = ttk.PanedWindow(main_container, orient=tk.HORIZONTAL)
         self.paned_window.pack(fill=tk.BOTH, expand=True)
@@ -468,21 +583,26 @@ class SerialToolGUI:
         scrollbar.pack(side="right", fill="y")
         self.left_canvas.pack(side="left", fill="both", expand=True)
 
-        # 鼠标滚轮绑定 - 绑定到左侧Canvas和内部Frame
+        # 鼠标滚轮绑定 - 仅在指针位于左侧面板内时全局接管滚轮，
+        # 离开后解除，避免数据显示区的滚轮事件也经过Python回调
         def _on_left_mousewheel(event):
             self.left_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        self.left_canvas.bind("<MouseWheel>", _on_left_mousewheel)
-        left_panel.bind("<MouseWheel>", _on_left_mousewheel)
+        def _on_left_enter(event):
+            self.left_canvas.bind_all("<MouseWheel>", _on_left_mousewheel)
 
-        # 为左侧面板内的所有子组件也绑定滚轮事件
-        def _bind_mousewheel_to_widget(widget):
-            widget.bind("<MouseWheel>", _on_left_mousewheel)
-            for child in widget.winfo_children():
-                _bind_mousewheel_to_widget(child)
+        def _on_left_leave(event):
+            # 进入子组件时也会触发Leave，指针仍在左侧面板内则保持绑定
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+            if widget is not None:
+                # 按路径层级判断是否为后代组件，避免同级的右侧面板(.!frame2)被前缀误判
+                path, container_path = str(widget), str(left_container)
+                if path == container_path or path.startswith(container_path + "."):
+                    return
+            self.left_canvas.unbind_all("<MouseWheel>")
 
-        # 延迟绑定，确保所有组件都已创建
-        self.root.after(200, lambda: _bind_mousewheel_to_widget(left_panel))
+        left_container.bind("<Enter>", _on_left_enter)
+        left_container.bind("<Leave>", _on_left_leave)
 
         # 右侧数据显示区域
         right_panel = ttk.Frame(self.paned_window)
@@ -499,15 +619,15 @@ class SerialToolGUI:
         # 串口选择
         port_frame = ttk.Frame(control_frame)
         port_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(
-            port_frame, text="串口:", font=("Microsoft YaHei UI", 10, "bold")
-        ).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(port_frame, text="串口:", font=_FONT_UI_10_BOLD).pack(
+            side=tk.LEFT, padx=(0, 10)
+        )
         self.port_var = tk.StringVar()
         self.port_combo = ttk.Combobox(
             port_frame,
             textvariable=self.port_var,
             width=16,
-            font=("Microsoft YaHei UI", 10),
+            font=_FONT_UI_10,
         )
         self.port_combo.pack(side=tk.LEFT, padx=(0, 10), fill=tk.X, expand=True)
         ttk.Button(
@@ -517,15 +637,15 @@ class SerialToolGUI:
         # 波特率 - 将修改按钮放在同一行
         baud_frame = ttk.Frame(control_frame)
         baud_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(
-            baud_frame, text="波特率:", font=("Microsoft YaHei UI", 10, "bold")
-        ).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Label(baud_frame, text="波特率:", font=_FONT_UI_10_BOLD).pack(
+            side=tk.LEFT, padx=(0, 10)
+        )
         self.baudrate_var = tk.StringVar(value="3000000")
         baudrate_combo = ttk.Combobox(
             baud_frame,
             textvariable=self.baudrate_var,
             width=10,
-            font=("Microsoft YaHei UI", 10),
+            font=_FONT_UI_10,
             values=["1152000", "2000000", "3000000", "6000000"],
         )
         baudrate_combo.pack(side=tk.LEFT, padx=(0, 5))
@@ -542,18 +662,18 @@ class SerialToolGUI:
         # 正则表达式过滤
         regex_frame = ttk.Frame(control_frame)
         regex_frame.pack(fill=tk.X, pady=8)
-        ttk.Label(
-            regex_frame, text="📋 正则表达式", font=("Microsoft YaHei UI", 10, "bold")
-        ).pack(anchor=tk.W, pady=(0, 6))
+        ttk.Label(regex_frame, text="📋 正则表达式", font=_FONT_UI_10_BOLD).pack(
+            anchor=tk.W, pady=(0, 6)
+        )
         self.regex_var = tk.StringVar()
-        ttk.Entry(
-            regex_frame, textvariable=self.regex_var, font=("Microsoft YaHei UI", 10)
-        ).pack(fill=tk.X, pady=2)
+        ttk.Entry(regex_frame, textvariable=self.regex_var, font=_FONT_UI_10).pack(
+            fill=tk.X, pady=2
+        )
         self.regex_var.trace_add("write", self._on_config_change)
         ttk.Label(
             regex_frame,
             text="多个正则式用逗号分隔",
-            font=("Microsoft YaHei UI", 9),
+            font=_FONT_UI_9,
             foreground="#6c757d",
         ).pack(anchor=tk.W, pady=(4, 0))
 
@@ -568,7 +688,7 @@ class SerialToolGUI:
         ttk.Label(
             filter_apply_frame,
             text="无需重启串口即可生效",
-            font=("Microsoft YaHei UI", 9),
+            font=_FONT_UI_9,
             foreground="#6c757d",
         ).pack(anchor=tk.W, pady=(6, 0))
 
@@ -599,167 +719,58 @@ class SerialToolGUI:
             btn_frame2, text="🗑️ 清屏", command=self._clear_display, width=12
         ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
 
-        # 批量操作区
-        batch_frame = ttk.LabelFrame(left_panel, text="⚡ 批量操作", padding=15)
-        batch_frame.pack(fill=tk.X, pady=8)
-
-        # 主要操作按钮 - 统一大小和布局
-        main_batch_frame = ttk.Frame(batch_frame)
-        main_batch_frame.pack(fill=tk.X, pady=5)
-        ttk.Button(
-            main_batch_frame,
-            text="💾 保存活动配置",
-            command=self._save_all_active_to_batch,
-            width=16,
-        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
-        ttk.Button(
-            main_batch_frame,
-            text="🚀 启动全部",
-            command=self._start_batch,
-            style="BatchStart.TButton",
-            width=16,
-        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
-
-        batch_btn_frame = ttk.Frame(batch_frame)
-        batch_btn_frame.pack(fill=tk.X, pady=5)
-        ttk.Button(
-            batch_btn_frame, text="👁️ 查看", command=self._show_batch_configs, width=16
-        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
-        ttk.Button(
-            batch_btn_frame, text="🗑️ 清空", command=self._clear_batch, width=16
-        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
-
-        # 高级工具按钮区 - 可折叠
-        self.tools_frame = ttk.LabelFrame(left_panel, text="🛠️ 高级工具", padding=8)
-        self.tools_frame.pack(fill=tk.X, pady=8)
-
-        # 折叠/展开标题按钮
-        title_frame = ttk.Frame(self.tools_frame)
-        title_frame.pack(fill=tk.X)
-        self.tools_toggle_btn = ttk.Button(
-            title_frame,
-            text="▼ 展开",
-            command=self._toggle_tools_section,
-            style="Small.TButton",
-        )
-        self.tools_toggle_btn.pack(fill=tk.X, pady=2)
-
-        # 工具按钮容器（初始隐藏）
-        self.tools_content = ttk.Frame(self.tools_frame)
-
-        # 工具按钮 - 网格布局，统一按钮大小
-        tools_grid = ttk.Frame(self.tools_content)
-        tools_grid.pack(fill=tk.X, pady=3)
-
-        # 第一行按钮 - 统一文字长度和宽度
-        ttk.Button(
-            tools_grid,
-            text="📄 日志过滤",
-            command=self._open_log_filter,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=0, column=0, padx=2, pady=2, sticky="ew")
-        ttk.Button(
-            tools_grid,
-            text="📂 日志文件夹",
-            command=self._open_log_folder,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=0, column=1, padx=2, pady=2, sticky="ew")
-        ttk.Button(
-            tools_grid,
-            text="📊 数据可视化",
-            command=self._open_visualizer,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=0, column=2, padx=2, pady=2, sticky="ew")
-        ttk.Button(
-            tools_grid,
-            text="🔍 数据分析",
-            command=self._open_analyzer,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=0, column=3, padx=2, pady=2, sticky="ew")
-
-        # 第二行按钮 - 统一文字长度和宽度
-        ttk.Button(
-            tools_grid,
-            text="🎬 录制回放",
-            command=self._open_recorder,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=1, column=0, padx=2, pady=2, sticky="ew")
-        ttk.Button(
-            tools_grid,
-            text="🤖 自动化测试",
-            command=self._open_automation,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=1, column=1, padx=2, pady=2, sticky="ew")
-        ttk.Button(
-            tools_grid,
-            text="🔧 实用工具箱",
-            command=self._open_utilities,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=1, column=2, padx=2, pady=2, sticky="ew")
-        ttk.Button(
-            tools_grid,
-            text="🔄 检查更新",
-            command=self._check_for_updates,
-            style="Small.TButton",
-            width=10,
-        ).grid(row=1, column=3, padx=2, pady=2, sticky="ew")
-
-        # 配置网格列权重，使按钮均匀分布
-        for i in range(4):
-            tools_grid.columnconfigure(i, weight=1)
-
         # 发送数据区 - 紧凑布局
         send_frame = ttk.LabelFrame(left_panel, text="📤 发送数据", padding=12)
         send_frame.pack(fill=tk.X, pady=8)
+        # 批量操作区和高级工具区不影响首屏，首帧绘制后再逐组创建并插到发送数据区之前
+        self._pending_builders = deque(
+            (
+                functools.partial(self._create_batch_section, left_panel, send_frame),
+                functools.partial(self._create_tools_section, left_panel, send_frame),
+            )
+        )
 
         send_port_frame = ttk.Frame(send_frame)
         send_port_frame.pack(fill=tk.X, pady=3)
-        ttk.Label(
-            send_port_frame, text="目标:", font=("Microsoft YaHei UI", 9, "bold")
-        ).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Label(send_port_frame, text="目标:", font=_FONT_UI_9_BOLD).pack(
+            side=tk.LEFT, padx=(0, 8)
+        )
         self.send_port_var = tk.StringVar()
         self.send_port_combo = ttk.Combobox(
             send_port_frame,
             textvariable=self.send_port_var,
             width=14,
-            font=("Microsoft YaHei UI", 9),
+            font=_FONT_UI_9,
         )
         self.send_port_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # 预设数据选择
         preset_frame = ttk.Frame(send_frame)
         preset_frame.pack(fill=tk.X, pady=3)
-        ttk.Label(
-            preset_frame, text="预设:", font=("Microsoft YaHei UI", 9, "bold")
-        ).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Label(preset_frame, text="预设:", font=_FONT_UI_9_BOLD).pack(
+            side=tk.LEFT, padx=(0, 8)
+        )
         self.preset_var = tk.StringVar()
         self.preset_combo = ttk.Combobox(
             preset_frame,
             textvariable=self.preset_var,
             width=14,
             state="readonly",
-            font=("Microsoft YaHei UI", 9),
+            font=_FONT_UI_9,
         )
         self.preset_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.preset_combo.bind("<<ComboboxSelected>>", self._on_preset_selected)
 
         send_data_frame = ttk.Frame(send_frame)
         send_data_frame.pack(fill=tk.X, pady=3)
-        ttk.Label(
-            send_data_frame, text="数据:", font=("Microsoft YaHei UI", 9, "bold")
-        ).pack(anchor=tk.W, pady=(0, 3))
+        ttk.Label(send_data_frame, text="数据:", font=_FONT_UI_9_BOLD).pack(
+            anchor=tk.W, pady=(0, 3)
+        )
         self.send_data_var = tk.StringVar()
         ttk.Entry(
             send_data_frame,
             textvariable=self.send_data_var,
-            font=("Microsoft YaHei UI", 9),
+            font=_FONT_UI_9,
         ).pack(fill=tk.X)
         self.send_data_var.trace_add("write", self._on_config_change)
 
@@ -786,16 +797,14 @@ class SerialToolGUI:
         # 搜索工具栏（初始隐藏）
         self.search_frame = ttk.Frame(display_frame)
 
-        search_label = ttk.Label(
-            self.search_frame, text="🔍", font=("Segoe UI Emoji", 10)
-        )
+        search_label = ttk.Label(self.search_frame, text="🔍", font=_FONT_EMOJI_10)
         search_label.pack(side=tk.LEFT, padx=(5, 5))
 
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(
             self.search_frame,
             textvariable=self.search_var,
-            font=("Microsoft YaHei UI", 9),
+            font=_FONT_UI_9,
             width=30,
         )
         self.search_entry.pack(side=tk.LEFT, padx=5)
@@ -810,7 +819,7 @@ class SerialToolGUI:
         ).pack(side=tk.LEFT, padx=2)
 
         self.search_result_label = ttk.Label(
-            self.search_frame, text="", font=("Microsoft YaHei UI", 9)
+            self.search_frame, text="", font=_FONT_UI_9
         )
         self.search_result_label.pack(side=tk.LEFT, padx=10)
 
@@ -822,7 +831,7 @@ class SerialToolGUI:
         self.text_display = scrolledtext.ScrolledText(
             display_frame,
             wrap=tk.WORD,
-            font=("Consolas", 11),
+            font=_FONT_MONO_11,
             background=self.theme_colors["text_bg"],
             foreground=self.theme_colors["text_fg"],
             insertbackground=self.theme_colors["text_fg"],
@@ -831,41 +840,44 @@ class SerialToolGUI:
             padx=12,
             pady=12,
             highlightthickness=0,
+            # 日志显示区只追加不编辑，关闭撤销栈避免长时间运行内存持续增长
+            undo=False,
+            maxundo=0,
+            autoseparators=False,
+            state=tk.DISABLED,
         )
         self.text_display.pack(fill=tk.BOTH, expand=True)
+        # DISABLED状态的Text在X11/macOS上点击不会获得焦点，手动获取以保证快捷键可用
+        self.text_display.bind("<Button-1>", lambda e: self.text_display.focus_set())
 
         # 绑定Ctrl+F快捷键
         self.text_display.bind("<Control-f>", lambda e: self._show_search())
 
-        # 为右侧文本显示区域绑定滚轮事件
-        def _on_right_mousewheel(event):
-            self.text_display.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        self.text_display.bind("<MouseWheel>", _on_right_mousewheel)
-
         # 搜索相关变量
         self.search_matches = []
         self.current_match_index = -1
 
         # 配置柔和的颜色标签
         self.text_display.tag_config(
-            "timestamp", foreground=self.theme_colors["timestamp"], font=("Consolas", 9)
+            "timestamp", foreground=self.theme_colors["timestamp"], font=_FONT_MONO_9
         )
         self.text_display.tag_config("default", foreground=self.theme_colors["default"])
         self.text_display.tag_config(
             "error",
             foreground=self.theme_colors["error"],
-            font=("Consolas", 10, "bold"),
+            font=_FONT_MONO_10_BOLD,
         )
         self.text_display.tag_config(
             "warning",
             foreground=self.theme_colors["warning"],
-            font=("Consolas", 10, "bold"),
+            font=_FONT_MONO_10_BOLD,
         )
         self.text_display.tag_config("success", foreground=self.theme_colors["success"])
 
-        # 动态端口颜色映射
-        self.port_color_tags = {}
+        # 端口 -> 颜色标签映射（按最近使用排序，超过上限时淘汰最久未用的端口）
+        self.port_color_tags: "OrderedDict[str, str]" = OrderedDict()
+        self.max_port_color_tags = 64
+        self._next_color_idx = 0
         self._init_color_tags()
 
         # 配置搜索高亮标签
@@ -880,49 +892,26 @@ class SerialToolGUI:
         bottom_info_frame = ttk.Frame(right_panel)
         bottom_info_frame.pack(fill=tk.X, pady=(10, 0))
 
-        # 活动串口列表 - 左侧
-        active_frame = ttk.LabelFrame(bottom_info_frame, text="📊 活动串口", padding=10)
-        active_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-
-        self.active_list = tk.Listbox(
-            active_frame,
-            height=3,
-            background=self.theme_colors["text_bg"],
-            foreground=self.theme_colors["text_fg"],
-            selectbackground=self.theme_colors["stats_bg"],
-            selectforeground=self.theme_colors["text_fg"],
-            relief=tk.FLAT,
-            borderwidth=0,
-            highlightthickness=0,
-            font=("Microsoft YaHei UI", 9),
+        # 活动串口列表 - 左侧（列表控件在_delayed_init中创建）
+        self.active_frame = ttk.LabelFrame(
+            bottom_info_frame, text="📊 活动串口", padding=10
         )
-        self.active_list.pack(fill=tk.BOTH, expand=True)
+        self.active_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        self.active_list = None
+        # 上次显示的列表项和发送串口选项，用于增量更新
+        self._active_list_items = []
+        self._send_port_values = ()
 
-        # 数据统计显示区域 - 右侧
+        # 数据统计显示区域 - 右侧（文本控件在_delayed_init中创建）
         self.stats_frame = ttk.LabelFrame(
             bottom_info_frame, text="📈 数据统计", padding=10
         )
         self.stats_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
-
-        # 使用Text widget来显示统计信息，支持多行 - 柔和样式
-        self.stats_display = tk.Text(
-            self.stats_frame,
-            height=3,
-            wrap=tk.WORD,
-            state=tk.DISABLED,
-            background=self.theme_colors["stats_bg"],
-            foreground=self.theme_colors["stats_fg"],
-            relief=tk.FLAT,
-            borderwidth=0,
-            highlightthickness=0,
-            font=("Microsoft YaHei UI", 10),
-            padx=10,
-            pady=5,
-        )
-        self.stats_display.pack(fill=tk.BOTH, expand=True)
-
-        # 优化：延迟配置颜色标签
-        self._stats_tags_configured = False
+        self.stats_display = None
+        # 上次渲染的统计快照，内容未变化时跳过重绘
+        self._last_stats_snapshot = None
+        # 上次查询时的统计版本号，计数器未变化时连统计查询和格式化都跳过
+        self._last_stats_version = None
 
         # 状态栏 - 使用tk.Label以支持背景色切换
         self.status_frame = tk.Frame(self.root, background=self.theme_colors["bg"])
@@ -935,50 +924,174 @@ class SerialToolGUI:
             relief=tk.FLAT,
             background=self.theme_colors["status_bg"],
             foreground=self.theme_colors["success"],
-            font=("Microsoft YaHei UI", 10),
+            font=_FONT_UI_10,
             padx=10,
             pady=5,
         )
         self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        # 主题切换按钮 - 放在状态栏右侧
-        self.theme_toggle_btn = tk.Button(
-            self.status_frame,
-            text="☀️" if self.is_dark_theme else "🌙",
-            command=self._toggle_theme,
-            background=self.theme_colors["status_bg"],
-            foreground=self.theme_colors["text_fg"],
-            relief=tk.FLAT,
-            borderwidth=0,
-            font=("Segoe UI Emoji", 14),
-            width=3,
-            cursor="hand2",
-        )
-        self.theme_toggle_btn.pack(side=tk.RIGHT, padx=5)
+        # 主题切换按钮 - 放在状态栏右侧
+        self.theme_toggle_btn = tk.Button(
+            self.status_frame,
+            text="☀️" if self.is_dark_theme else "🌙",
+            command=self._toggle_theme,
+            background=self.theme_colors["status_bg"],
+            foreground=self.theme_colors["text_fg"],
+            relief=tk.FLAT,
+            borderwidth=0,
+            font=_FONT_EMOJI_14,
+            width=3,
+            cursor="hand2",
+        )
+        self.theme_toggle_btn.pack(side=tk.RIGHT, padx=5)
+
+        # 版本信息标签 - 柔和的样式
+        version, build_time = get_version_info()
+        version_text = f"v{version}"
+        if build_time:
+            version_text += f" · {build_time}"
+        self.version_label = tk.Label(
+            self.status_frame,
+            text=version_text,
+            relief=tk.FLAT,
+            background=self.theme_colors["status_bg"],
+            foreground=self.theme_colors["version_fg"],
+            font=_FONT_UI_8,
+            padx=10,
+            pady=5,
+            cursor="hand2",
+        )
+        self.version_label.pack(side=tk.RIGHT, padx=5)
+        self.version_label.bind("<Button-1>", lambda e: self._check_for_updates())
+
+    def _pump_widget_builders(self):
+        """每次空闲时创建一组界面组件，组与组之间让Tk先完成绘制"""
+        if self._pending_builders:
+            self._pending_builders.popleft()()
+        if self._pending_builders:
+            self.root.after_idle(self._pump_widget_builders)
+
+    def _create_batch_section(self, parent, before):
+        """创建批量操作区（首帧后分批创建，插在before之前）"""
+        batch_frame = ttk.LabelFrame(parent, text="⚡ 批量操作", padding=15)
+        batch_frame.pack(fill=tk.X, pady=8, before=before)
+
+        # 主要操作按钮 - 统一大小和布局
+        main_batch_frame = ttk.Frame(batch_frame)
+        main_batch_frame.pack(fill=tk.X, pady=5)
+        ttk.Button(
+            main_batch_frame,
+            text="💾 保存活动配置",
+            command=self._save_all_active_to_batch,
+            width=16,
+        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
+        ttk.Button(
+            main_batch_frame,
+            text="🚀 启动全部",
+            command=self._start_batch,
+            style="BatchStart.TButton",
+            width=16,
+        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
+
+        batch_btn_frame = ttk.Frame(batch_frame)
+        batch_btn_frame.pack(fill=tk.X, pady=5)
+        ttk.Button(
+            batch_btn_frame, text="👁️ 查看", command=self._show_batch_configs, width=16
+        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
+        ttk.Button(
+            batch_btn_frame, text="🗑️ 清空", command=self._clear_batch, width=16
+        ).pack(side=tk.LEFT, padx=4, expand=True, fill=tk.X)
+
+    def _create_tools_section(self, parent, before):
+        """创建高级工具区（首帧后分批创建，插在before之前）"""
+        self.tools_frame = ttk.LabelFrame(parent, text="🛠️ 高级工具", padding=8)
+        self.tools_frame.pack(fill=tk.X, pady=8, before=before)
+
+        # 折叠/展开标题按钮
+        title_frame = ttk.Frame(self.tools_frame)
+        title_frame.pack(fill=tk.X)
+        self.tools_toggle_btn = ttk.Button(
+            title_frame,
+            text="▲ 收起" if self.tools_expanded else "▼ 展开",
+            command=self._toggle_tools_section,
+            style="Small.TButton",
+        )
+        self.tools_toggle_btn.pack(fill=tk.X, pady=2)
+
+        # 工具按钮容器（初始隐藏）
+        self.tools_content = ttk.Frame(self.tools_frame)
+
+        # 工具按钮 - 网格布局，统一按钮大小
+        tools_grid = ttk.Frame(self.tools_content)
+        tools_grid.pack(fill=tk.X, pady=3)
+
+        # 第一行按钮 - 统一文字长度和宽度
+        ttk.Button(
+            tools_grid,
+            text="📄 日志过滤",
+            command=self._open_log_filter,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=0, column=0, padx=2, pady=2, sticky="ew")
+        ttk.Button(
+            tools_grid,
+            text="📂 日志文件夹",
+            command=self._open_log_folder,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=0, column=1, padx=2, pady=2, sticky="ew")
+        ttk.Button(
+            tools_grid,
+            text="📊 数据可视化",
+            command=self._open_visualizer,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=0, column=2, padx=2, pady=2, sticky="ew")
+        ttk.Button(
+            tools_grid,
+            text="🔍 数据分析",
+            command=self._open_analyzer,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=0, column=3, padx=2, pady=2, sticky="ew")
+
+        # 第二行按钮 - 统一文字长度和宽度
+        ttk.Button(
+            tools_grid,
+            text="🎬 录制回放",
+            command=self._open_recorder,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=1, column=0, padx=2, pady=2, sticky="ew")
+        ttk.Button(
+            tools_grid,
+            text="🤖 自动化测试",
+            command=self._open_automation,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=1, column=1, padx=2, pady=2, sticky="ew")
+        ttk.Button(
+            tools_grid,
+            text="🔧 实用工具箱",
+            command=self._open_utilities,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=1, column=2, padx=2, pady=2, sticky="ew")
+        ttk.Button(
+            tools_grid,
+            text="🔄 检查更新",
+            command=self._check_for_updates,
+            style="Small.TButton",
+            width=10,
+        ).grid(row=1, column=3, padx=2, pady=2, sticky="ew")
 
-        # 版本信息标签 - 柔和的样式
-        version_text = f"v{VERSION}"
-        if BUILD_TIME:
-            version_text += f" · {BUILD_TIME}"
-        self.version_label = tk.Label(
-            self.status_frame,
-            text=version_text,
-            relief=tk.FLAT,
-            background=self.theme_colors["status_bg"],
-            foreground=self.theme_colors["version_fg"],
-            font=("Microsoft YaHei UI", 8),
-            padx=10,
-            pady=5,
-            cursor="hand2",
-        )
-        self.version_label.pack(side=tk.RIGHT, padx=5)
-        self.version_label.bind("<Button-1>", lambda e: self._check_for_updates())
+        # 配置网格列权重，使按钮均匀分布
+        for i in range(4):
+            tools_grid.columnconfigure(i, weight=1)
 
-        # 初始化更新检查器（用户需要配置自己的GitHub仓库信息）
-        self.update_checker = UpdateChecker(
-            owner="ZubenStar",  # 修改为你的GitHub用户名
-            repo="serial_tool",  # 修改为你的仓库名
-        )
+        # 配置可能已在本区域创建前加载，按当前折叠状态显示
+        if self.tools_expanded:
+            self.tools_content.pack(fill=tk.X, pady=(5, 0))
 
     def _toggle_tools_section(self):
         """切换高级工具区域显示/隐藏"""
@@ -1020,25 +1133,25 @@ class SerialToolGUI:
     def _update_widget_colors(self):
         """更新所有组件的颜色"""
         # 更新Canvas背景色
-        if hasattr(self, "left_canvas"):
+        if self.left_canvas is not None:
             self.left_canvas.config(background=self.theme_colors["bg"])
 
         # 更新主题切换按钮
-        if hasattr(self, "theme_toggle_btn"):
+        if self.theme_toggle_btn is not None:
             self.theme_toggle_btn.config(
                 background=self.theme_colors["status_bg"],
                 foreground=self.theme_colors["text_fg"],
             )
 
         # 更新状态栏背景色
-        if hasattr(self, "status_frame"):
+        if self.status_frame is not None:
             self.status_frame.config(background=self.theme_colors["bg"])
-        if hasattr(self, "status_bar"):
+        if self.status_bar is not None:
             self.status_bar.config(
                 background=self.theme_colors["status_bg"],
                 foreground=self.theme_colors["success"],
             )
-        if hasattr(self, "version_label"):
+        if self.version_label is not None:
             self.version_label.config(
                 background=self.theme_colors["status_bg"],
                 foreground=self.theme_colors["version_fg"],
@@ -1061,34 +1174,14 @@ class SerialToolGUI:
         self.text_display.tag_config("success", foreground=self.theme_colors["success"])
 
         # 更新端口颜色
-        self.color_map = self.theme_colors["port_colors"]
-        for port, tag_name in self.port_color_tags.items():
-            color_names = [
-                "BRIGHT_BLUE",
-                "BRIGHT_GREEN",
-                "BRIGHT_CYAN",
-                "BRIGHT_MAGENTA",
-                "BRIGHT_YELLOW",
-                "BRIGHT_RED",
-                "BLUE",
-                "GREEN",
-                "CYAN",
-                "MAGENTA",
-            ]
-            index = hash(port) % len(color_names)
-            color_name = color_names[index]
-            self.text_display.tag_config(
-                tag_name, foreground=self.color_map[color_name]
-            )
-
-        # 更新统计显示区域
-        self.stats_display.config(
-            background=self.theme_colors["stats_bg"],
-            foreground=self.theme_colors["stats_fg"],
-        )
+        self._init_color_tags()
 
-        # 重新配置统计标签（如果已配置）
-        if self._stats_tags_configured:
+        # 更新统计显示区域（已创建时）
+        if self.stats_display is not None:
+            self.stats_display.config(
+                background=self.theme_colors["stats_bg"],
+                foreground=self.theme_colors["stats_fg"],
+            )
             self.stats_display.tag_config(
                 "port_name", foreground=self.theme_colors["stats_port"]
             )
@@ -1099,13 +1192,14 @@ class SerialToolGUI:
                 "separator", foreground=self.theme_colors["stats_separator"]
             )
 
-        # 更新Listbox颜色
-        self.active_list.config(
-            background=self.theme_colors["text_bg"],
-            foreground=self.theme_colors["text_fg"],
-            selectbackground=self.theme_colors["stats_bg"],
-            selectforeground=self.theme_colors["text_fg"],
-        )
+        # 更新Listbox颜色（已创建时）
+        if self.active_list is not None:
+            self.active_list.config(
+                background=self.theme_colors["text_bg"],
+                foreground=self.theme_colors["text_fg"],
+                selectbackground=self.theme_colors["stats_bg"],
+                selectforeground=self.theme_colors["text_fg"],
+            )
 
         # 强制刷新显示
         self.root.update_idletasks()
@@ -1115,33 +1209,30 @@ class SerialToolGUI:
         # 从主题配色中获取端口颜色
         self.color_map = self.theme_colors["port_colors"]
 
-    def _get_port_color_tag(self, port: str) -> str:
-        """获取或创建端口的颜色标签"""
-        if port not in self.port_color_tags:
-            # 使用与serial_monitor相同的颜色选择逻辑
-            color_names = [
-                "BRIGHT_BLUE",
-                "BRIGHT_GREEN",
-                "BRIGHT_CYAN",
-                "BRIGHT_MAGENTA",
-                "BRIGHT_YELLOW",
-                "BRIGHT_RED",
-                "BLUE",
-                "GREEN",
-                "CYAN",
-                "MAGENTA",
-            ]
-            index = hash(port) % len(color_names)
-            color_name = color_names[index]
-            tag_name = f"port_{port}"
-
-            # 配置颜色标签
+        # 预先创建固定的颜色标签池，显示时只需查表，不再调用tag_config
+        for tag_name, color_name in zip(PORT_COLOR_TAGS, PORT_COLOR_NAMES):
             self.text_display.tag_config(
                 tag_name, foreground=self.color_map[color_name]
             )
-            self.port_color_tags[port] = tag_name
 
-        return self.port_color_tags[port]
+    def _get_port_color_tag(self, port: str) -> str:
+        """获取端口对应的颜色标签（从预建的标签池中轮流分配）"""
+        tag_name = self.port_color_tags.get(port)
+        if tag_name is not None:
+            self.port_color_tags.move_to_end(port)
+            return tag_name
+
+        # 超过上限时淘汰最久未使用的端口（标签池共享，无需删除Tk标签）
+        while len(self.port_color_tags) >= self.max_port_color_tags:
+            self.port_color_tags.popitem(last=False)
+
+        # 按首次出现顺序轮流分配颜色，不依赖hash()，每次启动结果一致
+        index = self._next_color_idx
+        self._next_color_idx = (index + 1) % len(PORT_COLOR_TAGS)
+        tag_name = PORT_COLOR_TAGS[index]
+        self.port_color_tags[port] = tag_name
+
+        return tag_name
 
     def _update_available_ports(self):
         """更新可用串口列表（优化：异步扫描）"""
@@ -1150,7 +1241,7 @@ class SerialToolGUI:
             monitor_mod = get_monitor_module()
             ports = monitor_mod["MultiSerialMonitor"].list_available_ports()
             # 在主线程更新UI
-            self.root.after(0, lambda: self._update_port_list(ports))
+            self.root.after(0, self._update_port_list, ports)
 
         # 启动时显示加载状态
         self.status_var.set("正在扫描串口...")
@@ -1165,14 +1256,41 @@ class SerialToolGUI:
         self.status_var.set(f"找到 {len(ports)} 个可用串口")
 
     def _get_filter_config(self):
-        """获取过滤配置 - 只使用正则表达式过滤"""
-        regex_patterns = [
-            r.strip() for r in self.regex_var.get().split(",") if r.strip()
-        ]
-        return regex_patterns
+        """获取过滤配置 - 只使用正则表达式过滤（按输入文本缓存解析结果）"""
+        raw = self.regex_var.get()
+        if raw != self._filter_cache_source:
+            self._filter_cache = tuple(
+                r for r in _FILTER_SPLIT_RE.split(raw.strip()) if r
+            )
+            self._filter_cache_source = raw
+        return list(self._filter_cache)
+
+    def _get_compiled_filters(self):
+        """获取预编译的过滤正则（按输入文本缓存，所有串口共享同一组Pattern）
+
+        正则无效时抛出re.error，由调用方提示用户。
+        """
+        patterns = self._get_filter_config()
+        raw = self._filter_cache_source
+        if raw != self._compiled_filter_source:
+            self._compiled_filters = tuple(self._compile_regex(p) for p in patterns)
+            self._compiled_filter_source = raw
+        return list(self._compiled_filters)
+
+    def _compile_regex(self, pattern: str) -> re.Pattern:
+        """编译单个正则并按模式字符串缓存"""
+        compiled = self._regex_cache.get(pattern)
+        if compiled is None:
+            compiled = re.compile(pattern)
+            if len(self._regex_cache) >= self.max_regex_cache_size:
+                self._regex_cache.clear()
+            self._regex_cache[pattern] = compiled
+        return compiled
 
     def _apply_filters_realtime(self):
         """实时应用过滤条件到所有活动串口，无需重启串口"""
+        from tkinter import messagebox
+
         active_ports = self.monitor.get_active_ports()
 
         if not active_ports:
@@ -1180,15 +1298,19 @@ class SerialToolGUI:
             return
 
         regex_patterns = self._get_filter_config()
+        try:
+            compiled_patterns = self._get_compiled_filters()
+        except re.error as e:
+            messagebox.showerror("错误", f"正则表达式无效: {e}")
+            return
 
         # 更新所有活动串口的过滤条件
-        success_count = 0
-        for port in active_ports:
-            if self.monitor.update_monitor_filters(port, [], regex_patterns):
-                # 更新本地配置
-                if port in self.port_configs:
-                    self.port_configs[port]["regex_patterns"] = regex_patterns
-                success_count += 1
+        updated_ports = self.monitor.update_all_filters([], compiled_patterns)
+        for port in updated_ports:
+            # 更新本地配置
+            if port in self.port_configs:
+                self.port_configs[port]["regex_patterns"] = regex_patterns
+        success_count = len(updated_ports)
 
         # 更新活动串口列表显示
         self._update_active_list()
@@ -1204,11 +1326,29 @@ class SerialToolGUI:
         self.status_var.set(f"已实时更新过滤: {success_count}个串口")
 
     def _on_config_change(self, *args):
-        """配置变化时自动保存"""
-        self._save_config()
+        """配置变化时标记待保存，每个config_save_delay窗口内最多写一次文件"""
+        # 配置尚在加载：记下被修改的变量，应用配置时保留用户的值，加载完成后再保存
+        if self._loading:
+            if args:
+                self._changed_while_loading.add(args[0])
+            self._config_dirty = True
+            return
+        self._config_dirty = True
+        if self._save_after_id is None:
+            self._save_after_id = self.root.after(
+                self.config_save_delay, self._flush_config_if_dirty
+            )
+
+    def _flush_config_if_dirty(self):
+        """定时器到期时保存配置（期间没有新修改则跳过）"""
+        self._save_after_id = None
+        if self._config_dirty:
+            self._save_config()
 
     def _start_monitor(self):
         """启动串口监控"""
+        from tkinter import messagebox
+
         port = self.port_var.get()
         if not port:
             messagebox.showwarning("警告", "请选择串口")
@@ -1221,12 +1361,15 @@ class SerialToolGUI:
             return
 
         regex_patterns = self._get_filter_config()
-
-        def callback(port, timestamp, data, colored_log_entry=""):
-            self._display_data(port, timestamp, data)
+        try:
+            compiled_patterns = self._get_compiled_filters()
+        except re.error as e:
+            messagebox.showerror("错误", f"正则表达式无效: {e}")
+            return
+        callback = self._make_display_callback(port)
 
         if self.monitor.add_monitor(
-            port, baudrate, [], regex_patterns, callback, enable_color=False
+            port, baudrate, [], compiled_patterns, callback, enable_color=False
         ):
             self.port_configs[port] = {
                 "baudrate": baudrate,
@@ -1239,6 +1382,8 @@ class SerialToolGUI:
 
     def _stop_monitor(self):
         """停止选中的串口监控"""
+        from tkinter import messagebox
+
         port = self.port_var.get()
         if not port:
             messagebox.showwarning("警告", "请选择串口")
@@ -1260,19 +1405,36 @@ class SerialToolGUI:
         self.status_var.set("已停止所有串口")
 
     def _update_active_list(self):
-        """更新活动串口列表"""
-        self.active_list.delete(0, tk.END)
+        """更新活动串口列表（只替换发生变化的部分）"""
         active_ports = self.monitor.get_active_ports()
 
+        items = []
         for port in active_ports:
             config = self.port_configs.get(port, {})
             info = f"{port} @ {config.get('baudrate', 'N/A')} bps"
             if config.get("regex_patterns"):
                 info += f" | 正则: {', '.join(config['regex_patterns'][:2])}"
-            self.active_list.insert(tk.END, info)
-
-        # 更新发送串口选择
-        self.send_port_combo["values"] = active_ports
+            items.append(info)
+
+        old_items = self._active_list_items
+        # 列表控件尚未创建时只更新发送串口选项，创建后会再次调用
+        if self.active_list is not None and items != old_items:
+            # 保留相同的前缀，从第一个不同的位置开始删除并重新插入
+            common = 0
+            for old, new in zip(old_items, items):
+                if old != new:
+                    break
+                common += 1
+            self.active_list.delete(common, tk.END)
+            if common < len(items):
+                self.active_list.insert(tk.END, *items[common:])
+            self._active_list_items = items
+
+        # 更新发送串口选择（选项未变化时不重新设置）
+        port_values = tuple(active_ports)
+        if port_values != self._send_port_values:
+            self.send_port_combo["values"] = port_values
+            self._send_port_values = port_values
         if active_ports and not self.send_port_var.get():
             self.send_port_combo.current(0)
 
@@ -1287,37 +1449,58 @@ class SerialToolGUI:
         if not text:
             return False
 
-        # 计算不可打印字符的比例
-        printable_chars = sum(1 for c in text if c.isprintable() or c in "\n\r\t")
+        # 快速路径：纯ASCII可打印文本（绝大多数正常数据）无需任何统计
+        is_ascii = text.isascii()
+        if is_ascii and text.isprintable():
+            return False
+
         total_chars = len(text)
+        # 一次C级translate去掉常见的可打印字符，剩余部分通常很短或为空
+        rest = text.translate(_PRINTABLE_ASCII_TABLE)
+        if not rest:
+            return False
+        if is_ascii:
+            # 纯ASCII时剩余的都是控制字符，不会有替换字符
+            return len(rest) / total_chars > 0.3
 
         # 如果不可打印字符超过30%，认为是乱码
-        if total_chars > 0 and (printable_chars / total_chars) < 0.7:
+        # （控制字符都属于不可打印字符，此项同时覆盖了控制字符过多的情况）
+        nonprintable_chars = sum(1 for c in rest if not c.isprintable())
+        if nonprintable_chars / total_chars > 0.3:
             return True
 
         # 检查是否包含过多的替换字符（�）
-        replacement_count = text.count("�")
-        if replacement_count > 0 and (replacement_count / total_chars) > 0.1:
-            return True
-
-        # 检查是否包含过多的连续控制字符
-        control_char_count = sum(1 for c in text if ord(c) < 32 and c not in "\n\r\t")
-        if control_char_count > 0 and (control_char_count / total_chars) > 0.3:
+        replacement_count = rest.count("�")
+        if replacement_count / total_chars > 0.1:
             return True
 
         return False
 
-    def _display_data(self, port, timestamp, data):
-        """显示接收到的数据（使用缓冲区批量处理）"""
-        # 检测并过滤乱码
-        if self._is_garbled_text(data):
+    def _make_display_callback(self, port: str):
+        """创建串口数据回调，端口颜色标签在主线程预先确定并随数据一起入队
+
+        乱码检测在串口线程的回调中完成，被过滤的行不会进入显示缓冲区。
+        """
+        port_tag = self._get_port_color_tag(port)
+        # 显示用的"[端口] "前缀每个串口只生成一次，不必每行重新格式化
+        port_prefix = sys.intern(f"[{port}] ")
+        is_garbled_text = self._is_garbled_text
+        display_data = self._display_data
+
+        def callback(port, timestamp, data, colored_log_entry=""):
             # 乱码数据不显示，只记录到日志
-            return
+            if not is_garbled_text(data):
+                display_data(port_prefix, timestamp, data, port_tag)
 
-        with self.buffer_lock:
-            self.display_buffer.append(
-                {"port": port, "timestamp": timestamp, "data": data}
-            )
+        return callback
+
+    def _display_data(self, port_prefix, timestamp, data, port_tag):
+        """将一行数据放入显示缓冲区（由UI循环批量插入）"""
+        buffer = self.display_buffer
+        if len(buffer) == buffer.maxlen:
+            # 缓冲区已满，append会挤掉最旧的一条（多线程下计数为近似值）
+            self._dropped_lines += 1
+        buffer.append((port_prefix, timestamp, data, port_tag))
 
     def _start_ui_update_loop(self):
         """启动UI更新循环"""
@@ -1326,64 +1509,148 @@ class SerialToolGUI:
     def _process_display_buffer(self):
         """批量处理显示缓冲区（激进策略：只要有数据就显示）"""
         try:
-            with self.buffer_lock:
-                buffer_size = len(self.display_buffer)
+            # 窗口最小化或隐藏时跳过渲染，数据暂存在有界缓冲区中，恢复后再显示
+            if self._is_window_hidden():
+                self._display_after_id = self.root.after(
+                    self.hidden_poll_interval, self._process_display_buffer
+                )
+                return
 
-                if buffer_size == 0:
-                    # 缓冲区为空，快速轮询
-                    self.root.after(self.update_interval, self._process_display_buffer)
-                    return
+            # 只有UI线程会取出数据，读到的长度不会被其他线程减少
+            buffer_size = len(self.display_buffer)
+
+            if buffer_size == 0:
+                # 数据流停止时补上最后一次滚动，保证最新数据可见
+                if self._autoscroll_pending:
+                    self._refresh_autoscroll_pending()
+                if self._autoscroll_pending:
+                    self.text_display.see(tk.END)
+                    self._autoscroll_pending = False
+                # 缓冲区为空，按自适应间隔继续轮询
+                self._display_after_id = self.root.after(
+                    self._next_update_interval(0), self._process_display_buffer
+                )
+                return
 
-                # 激进策略：只要有数据就全部显示，除非数据量特别大才分批
-                if buffer_size >= self.batch_threshold:
-                    # 数据量大：分批处理防止UI卡顿
-                    batch = self.display_buffer[: self.batch_threshold]
-                    self.display_buffer = self.display_buffer[self.batch_threshold :]
-                else:
-                    # 所有其他情况：立即全部显示
-                    batch = self.display_buffer[:buffer_size]
-                    self.display_buffer = []
+            work_start = time.perf_counter()
 
-            # 优化：禁用自动滚动，批量插入后一次性滚动
-            self.text_display.config(state=tk.NORMAL)
+            # 激进策略：只要有数据就全部显示，数据量大时分批处理防止UI卡顿
+            popleft = self.display_buffer.popleft
+            batch = [popleft() for _ in range(min(buffer_size, self.max_buffer_size))]
 
-            # 批量插入数据到文本框
-            for item in batch:
-                port = item["port"]
-                timestamp = item["timestamp"]
-                data = item["data"]
+            # 仅当用户停留在底部时才自动跟随，向上翻看历史时不打断
+            self._refresh_autoscroll_pending()
 
-                # 获取端口的颜色标签
-                port_tag = self._get_port_color_tag(port)
+            self.text_display.config(state=tk.NORMAL)
 
-                # 分段插入以应用不同的颜色
-                self.text_display.insert(tk.END, f"[{timestamp}] ", "timestamp")
-                self.text_display.insert(tk.END, f"[{port}] ", port_tag)
-                self.text_display.insert(tk.END, f"{data}\n", "default")
+            # 组装 (文本, 标签) 交替的参数列表，整批数据只需一次insert调用
+            # 复用同一个列表，避免每次刷新重新分配和扩容
+            insert_args = self._insert_args
+            insert_args.clear()
+
+            # UI跟不上时被丢弃的行数，在本批数据前插入一行提示
+            dropped = self._dropped_lines
+            if dropped:
+                self._dropped_lines = 0
+                insert_args.extend(
+                    (
+                        f"... 显示缓冲区已满，丢弃了 {dropped} 行（完整数据见日志文件）\n",
+                        "warning",
+                    )
+                )
+                self._line_count += 1
+
+            for port_prefix, timestamp, data, port_tag in batch:
+                insert_args.extend(
+                    (
+                        f"[{timestamp}] ",
+                        "timestamp",
+                        port_prefix,
+                        port_tag,
+                        f"{data}\n",
+                        "default",
+                    )
+                )
+            self.text_display.insert(tk.END, *insert_args)
+            self._line_count += len(batch)
+
+            # 滚动到底部：每autoscroll_every次刷新才执行一次，减少布局计算
+            self._flush_count += 1
+            if (
+                self._autoscroll_pending
+                and self._flush_count % self.autoscroll_every == 0
+            ):
+                self.text_display.see(tk.END)
+                self._autoscroll_pending = False
+
+            # 超出行数上限时在同一次刷新中清理，显示区大小始终有界
+            if self._line_count > self.max_display_lines:
+                self._trim_display_lines()
 
-            # 滚动到底部（一次性操作）
-            self.text_display.see(tk.END)
+            # 批次之间保持禁用状态，跳过编辑相关的事件处理
+            self.text_display.config(state=tk.DISABLED)
 
-            # 定期清理超出的行数（避免每次都检查）
-            current_time = time.time()
-            if current_time - self.last_trim_time > self.trim_interval:
-                self._trim_display_lines()
-                self.last_trim_time = current_time
+            # 记录本次刷新的耗时（指数移动平均），用于扣除下次的等待时间
+            work_time = time.perf_counter() - work_start
+            self._work_time_ema = 0.8 * self._work_time_ema + 0.2 * work_time
 
         except Exception as e:
             print(f"处理显示缓冲区错误: {e}")
 
-        # 继续快速循环
-        self.root.after(self.update_interval, self._process_display_buffer)
+        # 继续循环，间隔随缓冲区负载平滑调整；刷新本身的耗时计入间隔，
+        # 使两次刷新的起点相隔约update_interval，而不是耗时+间隔
+        interval = self._next_update_interval(buffer_size)
+        if buffer_size >= 2 * self.max_buffer_size:
+            # 取完本批后仍积压至少一整批：空闲时立即继续，只让出给待处理的事件和重绘
+            self._display_after_id = self.root.after_idle(self._process_display_buffer)
+            return
+        delay = max(1, interval - int(self._work_time_ema * 1000))
+        self._display_after_id = self.root.after(delay, self._process_display_buffer)
+
+    def _next_update_interval(self, buffer_size: int) -> int:
+        """根据缓冲区填充量的指数移动平均计算下次刷新间隔
+
+        填充量高于target_fill时缩短间隔，低于时延长，结果限制在
+        [min_update_interval, max_update_interval]之间，避免负载波动时来回跳变。
+        单次刷新取不完（出现积压）时立即切换到最短间隔。
+        """
+        self._ema_fill = 0.9 * self._ema_fill + 0.1 * buffer_size
+        if buffer_size > self.max_buffer_size:
+            # 本次未能取完，存在积压：不等平均值收敛，直接使用最短间隔
+            self.update_interval = self.min_update_interval
+            return self.update_interval
+        interval = self.update_interval * self.target_fill / max(self._ema_fill, 1.0)
+        self.update_interval = int(
+            min(self.max_update_interval, max(self.min_update_interval, interval))
+        )
+        return self.update_interval
+
+    def _refresh_autoscroll_pending(self):
+        """在插入新数据前确认是否仍需自动滚动
+
+        插入到末尾不会改变可见区域首行，首行变化只可能是用户滚动了视图，
+        此时放弃尚未执行的滚动；视图位于底部时则记下首行并标记待滚动
+        """
+        text = self.text_display
+        if self._autoscroll_pending and text.index("@0,0") != self._autoscroll_anchor:
+            self._autoscroll_pending = False
+        if not self._autoscroll_pending and text.yview()[1] >= 0.999:
+            self._autoscroll_pending = True
+            self._autoscroll_anchor = text.index("@0,0")
 
     def _trim_display_lines(self):
         """清理超出的显示行数"""
+        # 行数由插入时累加的计数器得出，无需向Tk查询索引
+        if self._line_count <= self.max_display_lines:
+            return
         try:
-            lines = int(self.text_display.index("end-1c").split(".")[0])
-            if lines > self.max_display_lines:
-                # 删除前面的行，保留最近的数据
-                delete_lines = lines - self.trim_to_lines
-                self.text_display.delete("1.0", f"{delete_lines}.0")
+            # 删除前面的行，保留最近的数据
+            delete_lines = self._line_count - self.trim_to_lines
+            self.text_display.delete("1.0", f"{delete_lines + 1}.0")
+            self._line_count = self.trim_to_lines
+            # 删除顶部行会改变可见区域首行的索引，重新记录以免误判为用户滚动
+            if self._autoscroll_pending:
+                self._autoscroll_anchor = self.text_display.index("@0,0")
         except Exception as e:
             print(f"清理显示行数错误: {e}")
 
@@ -1505,12 +1772,17 @@ class SerialToolGUI:
 
     def _clear_display(self):
         """清除显示区域"""
+        self.text_display.config(state=tk.NORMAL)
         self.text_display.delete("1.0", tk.END)
+        self.text_display.config(state=tk.DISABLED)
+        self._line_count = 0
         self._clear_search_highlights()
         self.status_var.set("已清除显示")
 
     def _send_data(self):
         """发送数据到串口"""
+        from tkinter import messagebox
+
         port = self.send_port_var.get()
         data = self.send_data_var.get()
 
@@ -1534,6 +1806,8 @@ class SerialToolGUI:
 
     def _save_preset_data(self):
         """保存当前数据为预设"""
+        from tkinter import messagebox
+
         data = self.send_data_var.get().strip()
 
         if not data:
@@ -1554,26 +1828,28 @@ class SerialToolGUI:
             return
 
         # 检查是否已存在同名预设
-        for preset in self.preset_data_list:
-            if preset["name"] == name:
-                result = messagebox.askyesno(
-                    "确认", f"预设 '{name}' 已存在，是否覆盖？"
-                )
-                if result:
-                    preset["data"] = data
-                    self._save_preset_data_to_file()
-                    self._update_preset_combo()
-                    self.status_var.set(f"已更新预设: {name}")
-                return
+        preset = self._preset_by_name.get(name)
+        if preset is not None:
+            result = messagebox.askyesno("确认", f"预设 '{name}' 已存在，是否覆盖？")
+            if result:
+                preset["data"] = data
+                self._save_preset_data_to_file()
+                self._update_preset_combo()
+                self.status_var.set(f"已更新预设: {name}")
+            return
 
         # 添加新预设
-        self.preset_data_list.append({"name": name, "data": data})
+        preset = {"name": name, "data": data}
+        self.preset_data_list.append(preset)
+        self._preset_by_name[name] = preset
         self._save_preset_data_to_file()
         self._update_preset_combo()
         self.status_var.set(f"已保存预设: {name}")
 
     def _delete_preset_data(self):
         """删除选中的预设"""
+        from tkinter import messagebox
+
         name = self.preset_var.get()
 
         if not name:
@@ -1585,7 +1861,10 @@ class SerialToolGUI:
             return
 
         # 删除预设
-        self.preset_data_list = [p for p in self.preset_data_list if p["name"] != name]
+        if self._preset_by_name.pop(name, None) is not None:
+            self.preset_data_list = [
+                p for p in self.preset_data_list if p["name"] != name
+            ]
         self._save_preset_data_to_file()
         self._update_preset_combo()
         self.preset_var.set("")
@@ -1599,16 +1878,14 @@ class SerialToolGUI:
             return
 
         # 查找对应的预设数据
-        for preset in self.preset_data_list:
-            if preset["name"] == name:
-                self.send_data_var.set(preset["data"])
-                self.status_var.set(f"已加载预设: {name}")
-                return
+        preset = self._preset_by_name.get(name)
+        if preset is not None:
+            self.send_data_var.set(preset["data"])
+            self.status_var.set(f"已加载预设: {name}")
 
     def _update_preset_combo(self):
         """更新预设下拉列表"""
-        names = [p["name"] for p in self.preset_data_list]
-        self.preset_combo["values"] = names
+        self.preset_combo["values"] = list(self._preset_by_name)
 
     def _save_preset_data_to_file(self):
         """保存预设数据到统一配置文件"""
@@ -1616,6 +1893,8 @@ class SerialToolGUI:
 
     def _add_to_batch(self):
         """将当前活动串口配置添加到批量配置列表"""
+        from tkinter import messagebox
+
         port = self.port_var.get()
         if not port:
             messagebox.showwarning("警告", "请选择串口")
@@ -1641,14 +1920,14 @@ class SerialToolGUI:
             config_source = "UI配置"
 
         # 检查是否已存在
-        for config in self.batch_port_configs:
-            if config["port"] == port:
-                messagebox.showinfo("提示", f"串口 {port} 已在批量配置中")
-                return
+        if port in self._batch_by_port:
+            messagebox.showinfo("提示", f"串口 {port} 已在批量配置中")
+            return
 
         config = {"port": port, "baudrate": baudrate, "regex_patterns": regex_patterns}
 
         self.batch_port_configs.append(config)
+        self._batch_by_port[port] = config
         self._save_batch_configs()
         self.status_var.set(
             f"已添加 {port} ({config_source}) 到批量配置 (共{len(self.batch_port_configs)}个)"
@@ -1656,29 +1935,30 @@ class SerialToolGUI:
 
     def _start_batch(self):
         """快速启动批量配置的所有串口"""
+        from tkinter import messagebox
+
         if not self.batch_port_configs:
             messagebox.showwarning("警告", "批量配置为空，请先添加串口配置")
             return
 
-        # 准备回调函数
-        def callback(port, timestamp, data, colored_log_entry=""):
-            self._display_data(port, timestamp, data)
-
-        # 为每个配置添加回调
-        configs_with_callback = []
-        for config in self.batch_port_configs:
-            config_copy = config.copy()
-            config_copy["callback"] = callback
-            config_copy["enable_color"] = False
-            configs_with_callback.append(config_copy)
+        # 按串口名准备回调，配置本身直接传入，无需逐个复制
+        batch_configs = list(self.batch_port_configs)
+        callbacks = {
+            config["port"]: self._make_display_callback(config["port"])
+            for config in batch_configs
+        }
 
-        # 使用并行启动
+        # 使用并行启动（实际启动在后台线程，状态栏由主循环自然重绘，无需强制刷新）
         self.status_var.set("正在并行启动批量串口...")
-        self.root.update()
+
+        # 启动结果按串口名对应回配置（取快照，后台线程运行期间列表可能被修改）
+        batch_by_port = dict(self._batch_by_port)
 
         # 在后台线程中执行以避免阻塞UI
         def start_thread():
-            results = self.monitor.add_monitors_parallel(configs_with_callback)
+            results = self.monitor.add_monitors_parallel(
+                batch_configs, callbacks=callbacks, enable_color=False
+            )
 
             # 更新配置和UI
             success_count = 0
@@ -1687,16 +1967,15 @@ class SerialToolGUI:
                 if success:
                     success_count += 1
                     # 保存端口配置
-                    for config in self.batch_port_configs:
-                        if config["port"] == port:
-                            self.port_configs[port] = config
-                            break
+                    config = batch_by_port.get(port)
+                    if config is not None:
+                        self.port_configs[port] = config
                 else:
                     failed_ports.append(port)
 
             # 在主线程中更新UI
             self.root.after(
-                0, lambda: self._update_after_batch_start(success_count, failed_ports)
+                0, self._update_after_batch_start, success_count, failed_ports
             )
 
         threading.Thread(target=start_thread, daemon=True).start()
@@ -1713,6 +1992,8 @@ class SerialToolGUI:
 
     def _clear_batch(self):
         """清空批量配置"""
+        from tkinter import messagebox
+
         if not self.batch_port_configs:
             messagebox.showinfo("提示", "批量配置已为空")
             return
@@ -1722,11 +2003,14 @@ class SerialToolGUI:
         )
         if result:
             self.batch_port_configs.clear()
+            self._batch_by_port.clear()
             self._save_batch_configs()
             self.status_var.set("已清空批量配置")
 
     def _show_batch_configs(self):
         """显示批量配置详情"""
+        from tkinter import messagebox
+
         if not self.batch_port_configs:
             messagebox.showinfo("批量配置", "批量配置为空")
             return
@@ -1742,6 +2026,8 @@ class SerialToolGUI:
 
     def _save_all_active_to_batch(self):
         """将所有当前活动串口配置保存到批量配置列表"""
+        from tkinter import messagebox
+
         active_ports = self.monitor.get_active_ports()
 
         if not active_ports:
@@ -1754,7 +2040,7 @@ class SerialToolGUI:
 
         for port in active_ports:
             # Check if already in batch
-            if any(config["port"] == port for config in self.batch_port_configs):
+            if port in self._batch_by_port:
                 skipped_count += 1
                 duplicate_ports.append(port)
                 continue
@@ -1768,6 +2054,7 @@ class SerialToolGUI:
                     "regex_patterns": config.get("regex_patterns", [])
                 }
                 self.batch_port_configs.append(batch_config)
+                self._batch_by_port[port] = batch_config
                 added_count += 1
             else:
                 # This shouldn't happen, but handle it gracefully
@@ -1777,6 +2064,7 @@ class SerialToolGUI:
                     "regex_patterns": []
                 }
                 self.batch_port_configs.append(batch_config)
+                self._batch_by_port[port] = batch_config
                 added_count += 1
 
         self._save_batch_configs()
@@ -1791,8 +2079,18 @@ class SerialToolGUI:
         else:
             messagebox.showinfo("提示", f"所有活动串口都已存在于批量配置中 ({skipped_count} 个)")
 
-    def _save_config(self):
-        """保存配置到统一配置文件"""
+    def _save_config(self, background: bool = True):
+        """保存配置到统一配置文件（在主线程序列化，后台线程写盘）"""
+        # 配置文件尚在后台加载时不写盘，否则会用默认值覆盖它；由_apply_config完成后补存
+        if self._loading:
+            self._config_dirty = True
+            return
+        # 立即保存时取消尚未执行的延迟保存
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._config_dirty = False
+
         config = {
             "default_settings": {
                 "baudrate": self.baudrate_var.get(),
@@ -1804,79 +2102,179 @@ class SerialToolGUI:
             "preset_data": self.preset_data_list,
             "batch_configs": self.batch_port_configs,
         }
+        # 条目较少时保持缩进便于手工查看，条目多时用紧凑格式加快保存
+        item_count = len(self.preset_data_list) + len(self.batch_port_configs)
         try:
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            data = _dumps_config(config, indent=item_count <= CONFIG_INDENT_MAX_ITEMS)
         except Exception as e:
             print(f"保存配置失败: {e}")
+            return
+
+        # 在写盘锁内分配序号：正在进行的写盘完成后_last_config_bytes才是文件的真实内容，
+        # 新序号同时作废所有尚未写入的旧请求
+        with self._config_write_lock:
+            self._config_save_seq += 1
+            seq = self._config_save_seq
+            # 内容与文件中一致时无需写盘
+            if data == self._last_config_bytes:
+                return
+
+        if background:
+            self._queue_config_write(data, seq)
+        else:
+            self._write_config_file(data, seq)
+
+    def _queue_config_write(self, data: bytes, seq: int):
+        """把配置交给后台写盘线程（队列只保留最新的一份）"""
+        if self._config_writer is None:
+            self._config_writer = threading.Thread(
+                target=self._config_writer_loop, daemon=True
+            )
+            self._config_writer.start()
+
+        write_queue = self._config_write_queue
+        while True:
+            try:
+                write_queue.put_nowait((data, seq))
+                return
+            except queue.Full:
+                # 写盘线程还没取走上一份，用新数据替换它
+                try:
+                    write_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _config_writer_loop(self):
+        """后台写盘线程：依次写入队列中的配置"""
+        while True:
+            data, seq = self._config_write_queue.get()
+            self._write_config_file(data, seq)
+
+    def _write_config_file(self, data: bytes, seq: int):
+        """写入配置文件（已有更新的保存请求时跳过旧数据）"""
+        with self._config_write_lock:
+            if seq != self._config_save_seq:
+                return
+            # 先写临时文件再原子替换，写入中途退出也不会留下损坏的配置文件
+            tmp_file = self.config_file + ".tmp"
+            try:
+                with open(tmp_file, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_file, self.config_file)
+                # 写入成功后才记录文件内容，排队中的数据不算已保存
+                self._last_config_bytes = data
+            except Exception as e:
+                # 写入失败时下次保存不能因内容相同而跳过
+                self._last_config_bytes = None
+                print(f"保存配置失败: {e}")
 
     def _save_batch_configs(self):
         """保存批量配置到统一配置文件"""
         self._save_config()
 
     def _load_config(self):
-        """从统一配置文件加载配置"""
+        """从统一配置文件加载配置（后台线程读取解析，主线程应用）"""
+        # 加载完成前不触发保存，避免默认值覆盖尚未读入的配置文件
+        self._loading = True
+        threading.Thread(target=self._read_config_file, daemon=True).start()
+
+    def _read_config_file(self):
+        """后台线程：读取并解析配置文件，不访问任何Tk对象"""
+        config = data = error = None
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-
-                # 加载默认设置
-                default_settings = config.get("default_settings", {})
-                if "baudrate" in default_settings:
-                    self.baudrate_var.set(default_settings["baudrate"])
-                if "regex" in default_settings:
-                    self.regex_var.set(default_settings["regex"])
-                if "send_data" in default_settings:
-                    self.send_data_var.set(default_settings["send_data"])
-
-                # 加载主题设置
-                theme_settings = config.get("theme", {})
-                if "is_dark" in theme_settings:
-                    self.is_dark_theme = theme_settings["is_dark"]
-                    # 更新主题按钮图标
-                    if hasattr(self, "theme_toggle_btn"):
-                        if self.is_dark_theme:
-                            self.theme_toggle_btn.config(text="☀️")
-                        else:
-                            self.theme_toggle_btn.config(text="🌙")
-
-                # 加载UI状态
-                ui_state = config.get("ui_state", {})
-                if "tools_expanded" in ui_state:
-                    self.tools_expanded = ui_state["tools_expanded"]
-                    # 应用折叠状态（延迟到组件创建后）
-                    if hasattr(self, "tools_toggle_btn"):
-                        if self.tools_expanded:
-                            self.tools_toggle_btn.config(text="▲ 收起")
-                            if hasattr(self, "tools_content"):
-                                self.tools_content.pack(fill=tk.X, pady=(5, 0))
-                        else:
-                            self.tools_toggle_btn.config(text="▼ 展开")
-
-                # 加载预设数据
-                self.preset_data_list = config.get("preset_data", [])
-                self._update_preset_combo()
-
-                # 加载批量配置（并迁移旧的 'regex' 键名）
-                batch_configs = config.get("batch_configs", [])
-                # 迁移旧配置：将 'regex' 重命名为 'regex_patterns'
-                for cfg in batch_configs:
-                    if "regex" in cfg and "regex_patterns" not in cfg:
-                        cfg["regex_patterns"] = cfg.pop("regex")
-                self.batch_port_configs = batch_configs
-
-                # 更新状态栏
-                status_parts = ["已加载配置"]
-                if self.batch_port_configs:
-                    status_parts.append(f"{len(self.batch_port_configs)}个批量串口")
-                if self.preset_data_list:
-                    status_parts.append(f"{len(self.preset_data_list)}个预设")
-                self.status_var.set(" | ".join(status_parts))
-
+                with open(self.config_file, "rb") as f:
+                    data = f.read()
+                config = _loads_config(data)
             except Exception as e:
-                print(f"加载配置失败: {e}")
+                error = e
+        self.root.after(0, self._apply_config, config, data, error)
+
+    def _apply_config(self, config, data, error):
+        """主线程：把解析好的配置应用到界面"""
+        # 读取期间用户做过的修改：应用时保留，完成后补存一次
+        pending_save = self._config_dirty
+        changed_vars = self._changed_while_loading
+        self._changed_while_loading = set()
+        try:
+            if error is not None:
+                print(f"加载配置失败: {error}")
                 self.status_var.set("配置加载失败")
+                return
+            if config is None:
+                return
+            self._last_config_bytes = data
+
+            # 加载默认设置
+            default_settings = config.get("default_settings", {})
+            for key, var in (
+                ("baudrate", self.baudrate_var),
+                ("regex", self.regex_var),
+                ("send_data", self.send_data_var),
+            ):
+                if key in default_settings and str(var) not in changed_vars:
+                    var.set(default_settings[key])
+
+            # 加载主题设置
+            theme_settings = config.get("theme", {})
+            if "is_dark" in theme_settings:
+                self.is_dark_theme = theme_settings["is_dark"]
+                # 更新主题按钮图标
+                if self.theme_toggle_btn is not None:
+                    if self.is_dark_theme:
+                        self.theme_toggle_btn.config(text="☀️")
+                    else:
+                        self.theme_toggle_btn.config(text="🌙")
+
+            # 加载UI状态
+            ui_state = config.get("ui_state", {})
+            if "tools_expanded" in ui_state:
+                self.tools_expanded = ui_state["tools_expanded"]
+                # 应用折叠状态（延迟到组件创建后）
+                if self.tools_toggle_btn is not None:
+                    if self.tools_expanded:
+                        self.tools_toggle_btn.config(text="▲ 收起")
+                        if self.tools_content is not None:
+                            self.tools_content.pack(fill=tk.X, pady=(5, 0))
+                    else:
+                        self.tools_toggle_btn.config(text="▼ 展开")
+
+            # 加载预设数据
+            # 读取期间新增的预设和批量配置与文件内容合并，同名时以新的为准
+            preset_by_name = {p["name"]: p for p in config.get("preset_data", [])}
+            preset_by_name.update(self._preset_by_name)
+            self.preset_data_list = list(preset_by_name.values())
+            self._preset_by_name = preset_by_name
+            self._update_preset_combo()
+
+            # 加载批量配置（并迁移旧的 'regex' 键名）
+            batch_configs = config.get("batch_configs", [])
+            # 迁移旧配置：将 'regex' 重命名为 'regex_patterns'
+            for cfg in batch_configs:
+                if "regex" in cfg and "regex_patterns" not in cfg:
+                    cfg["regex_patterns"] = cfg.pop("regex")
+            batch_by_port = {cfg["port"]: cfg for cfg in batch_configs}
+            batch_by_port.update(self._batch_by_port)
+            self.batch_port_configs = list(batch_by_port.values())
+            self._batch_by_port = batch_by_port
+
+            # 更新状态栏
+            status_parts = ["已加载配置"]
+            if self.batch_port_configs:
+                status_parts.append(f"{len(self.batch_port_configs)}个批量串口")
+            if self.preset_data_list:
+                status_parts.append(f"{len(self.preset_data_list)}个预设")
+            self.status_var.set(" | ".join(status_parts))
+
+        except Exception as e:
+            print(f"加载配置失败: {e}")
+            self.status_var.set("配置加载失败")
+        finally:
+            self._loading = False
+            # 应用配置本身触发的变量回调不算修改
+            self._config_dirty = False
+            if pending_save:
+                self._save_config()
 
     def _format_bytes(self, bytes_count: int) -> str:
         """格式化字节数为可读格式"""
@@ -1889,30 +2287,56 @@ class SerialToolGUI:
         else:
             return f"{bytes_count / (1024 * 1024 * 1024):.2f} GB"
 
+    def _is_window_hidden(self) -> bool:
+        """窗口是否处于最小化或隐藏状态（此时无需刷新界面）"""
+        return not self._window_visible
+
+    def _on_root_map(self, event):
+        """窗口恢复显示时立即刷新一次，补上隐藏期间积累的数据"""
+        # 根窗口的绑定对所有子组件生效，只处理根窗口自身的事件
+        if event.widget is not self.root or self._window_visible:
+            return
+        self._window_visible = True
+        if self._display_after_id is not None:
+            self.root.after_cancel(self._display_after_id)
+        self._display_after_id = self.root.after_idle(self._process_display_buffer)
+        # 统计循环已启动时同样立即刷新，不必等待隐藏期间的长间隔
+        if self._stats_after_id is not None:
+            self.root.after_cancel(self._stats_after_id)
+            self._stats_after_id = self.root.after_idle(self._start_stats_update_loop)
+
+    def _on_root_unmap(self, event):
+        """窗口最小化或隐藏时暂停界面刷新"""
+        if event.widget is self.root:
+            self._window_visible = False
+
     def _update_stats_display(self):
-        """更新统计信息显示（优化：延迟配置标签）"""
+        """更新统计信息显示"""
         try:
-            # 首次调用时配置颜色标签
-            if not self._stats_tags_configured:
-                self.stats_display.tag_config(
-                    "port_name",
-                    foreground=self.theme_colors["stats_port"],
-                    font=("Microsoft YaHei UI", 9, "bold"),
-                )
-                self.stats_display.tag_config(
-                    "bytes",
-                    foreground=self.theme_colors["stats_bytes"],
-                    font=("Microsoft YaHei UI", 9, "bold"),
-                )
-                self.stats_display.tag_config(
-                    "separator", foreground=self.theme_colors["stats_separator"]
-                )
-                self._stats_tags_configured = True
+            # 统计控件尚未创建或窗口不可见时跳过统计查询和重绘
+            if self.stats_display is None or self._is_window_hidden():
+                return
+
+            # 串口空闲时字节计数不变，直接跳过
+            stats_version = self.monitor.get_stats_version()
+            if stats_version == self._last_stats_version:
+                return
+            self._last_stats_version = stats_version
 
             # 获取所有串口的统计信息
             all_stats = self.monitor.get_all_stats()
 
-            if not all_stats:
+            # 按端口排序后生成快照，内容未变化时跳过重绘
+            snapshot = tuple(
+                (port, self._format_bytes(stats.get("total_bytes", 0)))
+                for port, stats in sorted(all_stats.items())
+            )
+            last_snapshot = self._last_stats_snapshot
+            if snapshot == last_snapshot:
+                return
+            self._last_stats_snapshot = snapshot
+
+            if not snapshot:
                 # 没有活动串口
                 self.stats_display.config(state=tk.NORMAL)
                 self.stats_display.delete("1.0", tk.END)
@@ -1920,26 +2344,44 @@ class SerialToolGUI:
                 self.stats_display.config(state=tk.DISABLED)
                 return
 
-            # 构建显示内容
             self.stats_display.config(state=tk.NORMAL)
-            self.stats_display.delete("1.0", tk.END)
-
-            # 按端口排序
-            sorted_ports = sorted(all_stats.keys())
 
-            for i, port in enumerate(sorted_ports):
-                stats = all_stats[port]
-                bytes_count = stats["total_bytes"]
-                formatted_bytes = self._format_bytes(bytes_count)
-
-                # 插入端口名
-                self.stats_display.insert(tk.END, port, "port_name")
-                self.stats_display.insert(tk.END, ": ", "separator")
-                self.stats_display.insert(tk.END, formatted_bytes, "bytes")
+            ports = [port for port, _ in snapshot]
+            if last_snapshot and ports == [port for port, _ in last_snapshot]:
+                # 串口列表未变化：只替换字节数发生变化的片段
+                for index, ((_, formatted_bytes), (_, old_bytes)) in enumerate(
+                    zip(snapshot, last_snapshot)
+                ):
+                    if formatted_bytes == old_bytes:
+                        continue
+                    bytes_tag = f"stats_bytes_{index}"
+                    start, end = self.stats_display.tag_ranges(bytes_tag)[:2]
+                    self.stats_display.delete(start, end)
+                    self.stats_display.insert(
+                        start, formatted_bytes, ("bytes", bytes_tag)
+                    )
+            else:
+                # 串口列表变化时整体重建
+                self.stats_display.delete("1.0", tk.END)
 
-                # 如果不是最后一个，添加分隔符
-                if i < len(sorted_ports) - 1:
-                    self.stats_display.insert(tk.END, "  |  ", "separator")
+                # 组装 (文本, 标签) 交替的参数列表，与主显示区相同只需一次insert调用
+                # 每个字节数片段另带一个按位置编号的标签，便于之后单独替换
+                insert_args = []
+                for index, (port, formatted_bytes) in enumerate(snapshot):
+                    insert_args.extend(
+                        (
+                            "  |  ",
+                            "separator",
+                            port,
+                            "port_name",
+                            ": ",
+                            "separator",
+                            formatted_bytes,
+                            ("bytes", f"stats_bytes_{index}"),
+                        )
+                    )
+                # 去掉开头多余的分隔符
+                self.stats_display.insert(tk.END, *insert_args[2:])
 
             self.stats_display.config(state=tk.DISABLED)
 
@@ -1947,13 +2389,29 @@ class SerialToolGUI:
             print(f"更新统计信息错误: {e}")
 
     def _start_stats_update_loop(self):
-        """启动统计信息更新循环"""
+        """启动统计信息更新循环（窗口隐藏时降低轮询频率）"""
+        if self._is_window_hidden():
+            self._stats_after_id = self.root.after(
+                self.hidden_stats_interval, self._start_stats_update_loop
+            )
+            return
+        # 统计刷新优先级低，放到空闲时执行，让位于数据显示和用户输入
+        self._stats_after_id = self.root.after_idle(self._stats_update_tick)
+
+    def _stats_update_tick(self):
+        """空闲时刷新统计信息并安排下一轮"""
         self._update_stats_display()
-        self.root.after(self.stats_update_interval, self._start_stats_update_loop)
+        self._stats_after_id = self.root.after(
+            self.stats_update_interval, self._start_stats_update_loop
+        )
 
     def _open_log_filter(self):
         """打开日志过滤工具"""
+        from tkinter import messagebox
+
         try:
+            from log_filter import LogFilterWindow
+
             # 传递应用的日志目录到日志过滤窗口
             LogFilterWindow(self.root, log_dir=self.monitor.log_dir)
             self.status_var.set("已打开日志过滤工具")
@@ -1969,6 +2427,8 @@ class SerialToolGUI:
 
     def _open_visualizer(self):
         """打开数据可视化工具"""
+        from tkinter import messagebox
+
         try:
             from data_visualizer import DataVisualizer
 
@@ -1980,6 +2440,8 @@ class SerialToolGUI:
 
     def _open_analyzer(self):
         """打开数据分析工具"""
+        from tkinter import messagebox
+
         try:
             from data_analyzer import DataAnalyzerWindow
 
@@ -1991,6 +2453,8 @@ class SerialToolGUI:
 
     def _open_recorder(self):
         """打开录制回放工具"""
+        from tkinter import messagebox
+
         try:
             from recorder_player import RecorderPlayerWindow
 
@@ -2002,6 +2466,8 @@ class SerialToolGUI:
 
     def _open_automation(self):
         """打开自动化测试工具"""
+        from tkinter import messagebox
+
         try:
             from automation_tester import AutomationTesterWindow
 
@@ -2013,6 +2479,8 @@ class SerialToolGUI:
 
     def _open_utilities(self):
         """打开实用工具箱"""
+        from tkinter import messagebox
+
         try:
             from utility_tools import UtilityToolsWindow
 
@@ -2024,6 +2492,8 @@ class SerialToolGUI:
 
     def _open_log_folder(self):
         """打开日志保存文件夹"""
+        from tkinter import messagebox
+
         try:
             import subprocess
             import sys
@@ -2049,6 +2519,8 @@ class SerialToolGUI:
 
     def _change_current_baudrate(self):
         """修改当前选中串口的波特率"""
+        from tkinter import messagebox
+
         port = self.port_var.get()
         if not port:
             messagebox.showwarning("警告", "请选择要修改波特率的串口")
@@ -2098,6 +2570,8 @@ class SerialToolGUI:
 
     def _change_all_baudrates(self):
         """修改所有活动串口的波特率"""
+        from tkinter import messagebox
+
         active_ports = self.monitor.get_active_ports()
 
         if not active_ports:
@@ -2159,24 +2633,26 @@ class SerialToolGUI:
     def _check_for_updates(self):
         """检查应用程序更新"""
         self.status_var.set("正在检查更新...")
+        # 在主线程中创建更新检查器，后台线程只负责网络请求
+        update_checker = self.update_checker
 
         def check_updates_thread():
             try:
-                has_update, update_info = self.update_checker.check_for_updates()
+                has_update, update_info = update_checker.check_for_updates()
 
                 # 在主线程中更新UI
-                self.root.after(
-                    0, lambda: self._show_update_result(has_update, update_info)
-                )
+                self.root.after(0, self._show_update_result, has_update, update_info)
             except Exception as e:
                 error_msg = f"检查更新时出错: {str(e)}"
-                self.root.after(0, lambda: self._show_update_error(error_msg))
+                self.root.after(0, self._show_update_error, error_msg)
 
         # 在后台线程检查更新，避免阻塞UI
         threading.Thread(target=check_updates_thread, daemon=True).start()
 
     def _show_update_result(self, has_update, update_info):
         """显示更新检查结果"""
+        from tkinter import messagebox, scrolledtext
+
         if has_update and update_info:
             summary = self.update_checker.get_update_summary(update_info)
 
@@ -2207,7 +2683,7 @@ class SerialToolGUI:
             text_widget = scrolledtext.ScrolledText(
                 text_frame,
                 wrap=tk.WORD,
-                font=("Microsoft YaHei UI", 10),
+                font=_FONT_UI_10,
                 background=self.theme_colors["text_bg"],
                 foreground=self.theme_colors["text_fg"],
                 relief=tk.FLAT,
@@ -2227,7 +2703,7 @@ class SerialToolGUI:
             tip_label = ttk.Label(
                 dialog,
                 text="💡 选择更新方式：",
-                font=("Microsoft YaHei UI", 10, "bold"),
+                font=_FONT_UI_10_BOLD,
             )
             tip_label.pack(pady=(5, 10))
 
@@ -2276,7 +2752,7 @@ class SerialToolGUI:
             desc_label = ttk.Label(
                 desc_frame,
                 text=desc_text,
-                font=("Microsoft YaHei UI", 9),
+                font=_FONT_UI_9,
                 foreground="#858585",
                 justify=tk.LEFT,
             )
@@ -2294,6 +2770,8 @@ class SerialToolGUI:
 
     def _download_update(self, update_info):
         """下载更新文件"""
+        from tkinter import messagebox
+
         # 获取第一个资源文件的下载链接
         assets = update_info.get("assets", [])
         if not assets:
@@ -2327,7 +2805,7 @@ class SerialToolGUI:
         ttk.Label(
             info_frame,
             text=f"正在下载: {filename}",
-            font=("Microsoft YaHei UI", 11, "bold"),
+            font=_FONT_UI_11_BOLD,
         ).pack()
 
         # 进度条
@@ -2337,9 +2815,7 @@ class SerialToolGUI:
         progress_bar = ttk.Progressbar(progress_frame, mode="determinate", length=400)
         progress_bar.pack(pady=10)
 
-        progress_label = ttk.Label(
-            progress_frame, text="准备下载...", font=("Microsoft YaHei UI", 10)
-        )
+        progress_label = ttk.Label(progress_frame, text="准备下载...", font=_FONT_UI_10)
         progress_label.pack()
 
         # 取消按钮
@@ -2403,6 +2879,8 @@ class SerialToolGUI:
 
     def _on_download_complete(self, success, result, dialog):
         """下载完成回调"""
+        from tkinter import messagebox
+
         dialog.destroy()
 
         if success:
@@ -2449,26 +2927,32 @@ class SerialToolGUI:
 
     def _on_download_error(self, error_msg, dialog):
         """下载错误回调"""
+        from tkinter import messagebox
+
         dialog.destroy()
         messagebox.showerror("下载错误", f"下载时出错: {error_msg}")
         self.status_var.set("下载失败")
 
     def _show_update_error(self, error_msg):
         """显示更新检查错误"""
+        from tkinter import messagebox
+
         messagebox.showerror("错误", error_msg)
         self.status_var.set("检查更新失败")
 
     def close(self):
         """关闭应用，确保资源正确清理"""
         try:
-            # 保存配置
-            self._save_config()
+            # 保存配置（退出前同步写盘，避免后台线程随进程结束而丢失）
+            # 同步写入会等待进行中的后台写盘完成，并使队列中的旧数据作废
+            self._save_config(background=False)
         except Exception as e:
             print(f"保存配置时出错: {e}")
 
         try:
-            # 停止所有串口监控
-            self.monitor.stop_all()
+            # 停止所有串口监控（未创建过monitor时无需导入串口模块）
+            if self._monitor is not None:
+                self._monitor.stop_all()
         except Exception as e:
             print(f"停止串口监控时出错: {e}")
 
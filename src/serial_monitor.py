@@ -6,7 +6,17 @@ import queue
 from datetime import datetime
 from pathlib import Path
 import time
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Union
+
+# 可选依赖：安装google-re2时用线性时间引擎执行合并后的过滤正则
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# RE2中\w \d \s \b等只匹配ASCII，而re按Unicode匹配（如中文日志中的"错误\w+"），
+# 含这些转义（前面不是被转义的反斜杠）的正则不交给RE2，保证匹配结果与re一致
+_UNICODE_SENSITIVE_ESCAPE = re.compile(r'(?<!\\)(?:\\\\)*\\[wWdDsSbB]')
 
 # ANSI颜色代码
 class Colors:
@@ -55,12 +65,51 @@ class Colors:
         return colors[index]
 
 
+def _compile_patterns(patterns) -> List[re.Pattern]:
+    """编译正则表达式列表，已编译的Pattern对象直接复用"""
+    return [p if isinstance(p, re.Pattern) else re.compile(p) for p in patterns]
+
+
+def _build_filter_search(keywords: List[str], regex_patterns: List[re.Pattern]) -> Optional[Callable]:
+    r"""将关键词和正则表达式合并为单个预编译正则，返回其search方法
+    
+    每行数据只需一次search调用，而不是逐个关键词/正则匹配。
+    多个带分组的正则（反向引用编号会错位）、带标志的正则或合并后
+    编译失败时返回None，退回逐个匹配。
+    已安装re2时优先用RE2编译，不支持的语法（如反向引用、环视）使用标准库re；
+    含\w、\d、\s、\b等转义的正则在RE2中只匹配ASCII，同样使用re。
+    """
+    if not keywords and not regex_patterns:
+        return None
+    
+    grouped = [p for p in regex_patterns if p.groups]
+    if len(grouped) > 1 or any(p.flags != re.UNICODE for p in regex_patterns):
+        return None
+    
+    # 带分组的正则放在最前面，保证其分组编号不变
+    plain = [p for p in regex_patterns if not p.groups]
+    parts = [f"(?:{p.pattern})" for p in grouped + plain]
+    parts.extend(re.escape(keyword) for keyword in keywords)
+    combined = '|'.join(parts)
+    if re2 is not None and not any(
+        _UNICODE_SENSITIVE_ESCAPE.search(p.pattern) for p in regex_patterns
+    ):
+        try:
+            return re2.compile(combined).search
+        except Exception:
+            pass
+    try:
+        return re.compile(combined).search
+    except re.error:
+        return None
+
+
 class SerialMonitor:
     """串口监控类，支持多串口同时监控"""
     
     def __init__(self, port: str, baudrate: int = 9600,
                  keywords: Optional[List[str]] = None,
-                 regex_patterns: Optional[List[str]] = None,
+                 regex_patterns: Optional[List[Union[str, re.Pattern]]] = None,
                  log_dir: str = "logs",
                  callback: Optional[Callable] = None,
                  save_all_to_log: bool = True,
@@ -68,8 +117,9 @@ class SerialMonitor:
                  enable_color: bool = True):
         self.port = port
         self.baudrate = baudrate
-        self.keywords = keywords or []
-        self.regex_patterns = [re.compile(pattern) for pattern in (regex_patterns or [])]
+        self.keywords = list(keywords or [])
+        self.regex_patterns = _compile_patterns(regex_patterns or [])
+        self._filter_search = _build_filter_search(self.keywords, self.regex_patterns)
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         self.callback = callback
@@ -95,24 +145,38 @@ class SerialMonitor:
         safe_port_name = port.replace('/', '_').replace('\\', '_')
         self.log_file = self.log_dir / f"{safe_port_name}_{timestamp}.log"
         
-    def update_filters(self, keywords: Optional[List[str]] = None, regex_patterns: Optional[List[str]] = None):
+    def update_filters(self, keywords: Optional[List[str]] = None,
+                       regex_patterns: Optional[List[Union[str, re.Pattern]]] = None):
         """动态更新过滤条件，无需重启串口
         
         Args:
             keywords: 新的关键词列表
-            regex_patterns: 新的正则表达式列表（字符串）
+            regex_patterns: 新的正则表达式列表（字符串或已编译的re.Pattern）
         """
         if keywords is not None:
-            self.keywords = keywords
+            self.keywords = list(keywords)
         
         if regex_patterns is not None:
-            self.regex_patterns = [re.compile(pattern) for pattern in regex_patterns]
+            self.regex_patterns = _compile_patterns(regex_patterns)
+        
+        self._filter_search = _build_filter_search(self.keywords, self.regex_patterns)
+    
+    def _set_filters(self, keywords: List[str], regex_patterns: List[re.Pattern],
+                     filter_search: Optional[Callable]):
+        """直接设置已编译的过滤条件和合并后的search方法（由MultiSerialMonitor共享）"""
+        self.keywords = keywords
+        self.regex_patterns = regex_patterns
+        self._filter_search = filter_search
     
     def _matches_filter(self, data: str) -> bool:
         """检查数据是否匹配过滤条件"""
         if not self.keywords and not self.regex_patterns:
             return True
         
+        filter_search = self._filter_search
+        if filter_search is not None:
+            return filter_search(data) is not None
+        
         for keyword in self.keywords:
             if keyword in data:
                 return True
@@ -143,57 +207,76 @@ class SerialMonitor:
                     
                     buffer += data
                     
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
+                    # 一次分割出所有完整行，最后一段是未结束的半行，留到下次拼接
+                    lines = buffer.split('\n')
+                    buffer = lines.pop()
+                    log_entries = []  # 本次读取的日志条目，最后一次性写入文件
+                    
+                    for line in lines:
                         line = line.strip()
                         
                         if line:
-                            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                            log_entry = f"[{timestamp}] [{self.port}] {line}"
-                            
-                            # 始终保存到日志文件（如果启用）
-                            if self.save_all_to_log:
-                                self._write_log(log_entry)
-                            
-                            # 检查是否匹配过滤条件
-                            if self._matches_filter(line):
-                                # 如果没有启用保存全部日志，则只保存匹配的
-                                if not self.save_all_to_log:
-                                    self._write_log(log_entry)
-                                
-                                # 创建带颜色的日志条目
-                                colored_log_entry = self._format_colored_output(timestamp, line)
-                                
-                                self.data_queue.put({
-                                    'port': self.port,
-                                    'timestamp': timestamp,
-                                    'data': line,
-                                    'log_entry': log_entry,
-                                    'colored_log_entry': colored_log_entry,
-                                    'color': self.port_color
-                                })
-                                
-                                # 只有匹配的数据才触发回调（带节流）
-                                if self.callback:
-                                    self._throttled_callback(self.port, timestamp, line, colored_log_entry)
+                            try:
+                                self._process_line(line, log_entries)
+                            except Exception as e:
+                                # 单行处理出错只影响该行，本次读取的其余行照常记录和显示
+                                log_entries.append(self._report_read_error(e))
+                    
+                    if log_entries:
+                        self._write_log('\n'.join(log_entries))
                 else:
                     time.sleep(0.01)
                     
             except Exception as e:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                error_msg = f"[{timestamp}] [{self.port}] 错误: {e}"
-                self._write_log(error_msg)
-                
-                # 打印带颜色的错误信息
-                if self.enable_color:
-                    colored_error = f"{Colors.BRIGHT_BLACK}[{timestamp}]{Colors.RESET} {self.port_color}[{self.port}]{Colors.RESET} {Colors.BRIGHT_RED}错误: {e}{Colors.RESET}"
-                    print(colored_error)
-                else:
-                    print(error_msg)
+                self._write_log(self._report_read_error(e))
                 
                 if isinstance(e, serial.SerialException):
                     break
     
+    def _process_line(self, line: str, log_entries: List[str]):
+        """处理一行完整数据：收集日志条目，匹配过滤条件时入队并触发回调"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        log_entry = f"[{timestamp}] [{self.port}] {line}"
+        
+        # 始终保存到日志文件（如果启用）
+        if self.save_all_to_log:
+            log_entries.append(log_entry)
+        
+        # 检查是否匹配过滤条件
+        if self._matches_filter(line):
+            # 如果没有启用保存全部日志，则只保存匹配的
+            if not self.save_all_to_log:
+                log_entries.append(log_entry)
+            
+            # 创建带颜色的日志条目
+            colored_log_entry = self._format_colored_output(timestamp, line)
+            
+            self.data_queue.put({
+                'port': self.port,
+                'timestamp': timestamp,
+                'data': line,
+                'log_entry': log_entry,
+                'colored_log_entry': colored_log_entry,
+                'color': self.port_color
+            })
+            
+            # 只有匹配的数据才触发回调（带节流）
+            if self.callback:
+                self._throttled_callback(self.port, timestamp, line, colored_log_entry)
+    
+    def _report_read_error(self, e: Exception) -> str:
+        """打印读取错误，返回写入日志的错误信息"""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        error_msg = f"[{timestamp}] [{self.port}] 错误: {e}"
+        
+        # 打印带颜色的错误信息
+        if self.enable_color:
+            colored_error = f"{Colors.BRIGHT_BLACK}[{timestamp}]{Colors.RESET} {self.port_color}[{self.port}]{Colors.RESET} {Colors.BRIGHT_RED}错误: {e}{Colors.RESET}"
+            print(colored_error)
+        else:
+            print(error_msg)
+        return error_msg
+    
     def _format_colored_output(self, timestamp: str, data: str) -> str:
         """格式化带颜色的输出"""
         if self.enable_color:
@@ -378,7 +461,7 @@ class MultiSerialMonitor:
     
     def add_monitor(self, port: str, baudrate: int = 9600,
                    keywords: Optional[List[str]] = None,
-                   regex_patterns: Optional[List[str]] = None,
+                   regex_patterns: Optional[List[Union[str, re.Pattern]]] = None,
                    callback: Optional[Callable] = None,
                    save_all_to_log: bool = True,
                    callback_throttle_ms: int = 10,
@@ -389,7 +472,7 @@ class MultiSerialMonitor:
             port: 串口名称
             baudrate: 波特率
             keywords: 关键词列表（用于过滤显示）
-            regex_patterns: 正则表达式列表（用于过滤显示）
+            regex_patterns: 正则表达式列表（用于过滤显示，可传入已编译的re.Pattern）
             callback: 回调函数（只在数据匹配过滤条件时调用）
             save_all_to_log: 是否将所有数据保存到日志（默认True，即使有过滤条件也保存全部数据）
             callback_throttle_ms: 回调节流时间（毫秒），默认1ms
@@ -420,11 +503,19 @@ class MultiSerialMonitor:
             return True
         return False
     
-    def add_monitors_parallel(self, port_configs: List[Dict]) -> Dict[str, bool]:
+    def add_monitors_parallel(self, port_configs: List[Dict],
+                              callbacks: Optional[Dict[str, Callable]] = None, *,
+                              baudrate: Optional[int] = None,
+                              keywords: Optional[List[str]] = None,
+                              regex_patterns: Optional[List[Union[str, re.Pattern]]] = None,
+                              callback: Optional[Callable] = None,
+                              save_all_to_log: Optional[bool] = None,
+                              callback_throttle_ms: Optional[int] = None,
+                              enable_color: Optional[bool] = None) -> Dict[str, bool]:
         """并行添加多个串口监控（加快启动速度）
         
         Args:
-            port_configs: 串口配置列表，每个配置包含:
+            port_configs: 串口配置列表（只读取，不会被修改），每个配置包含:
                 - port: 串口名称
                 - baudrate: 波特率 (可选，默认9600)
                 - keywords: 关键词列表 (可选)
@@ -433,25 +524,48 @@ class MultiSerialMonitor:
                 - save_all_to_log: 是否保存所有数据 (可选，默认True)
                 - callback_throttle_ms: 回调节流时间 (可选，默认1)
                 - enable_color: 是否启用颜色 (可选，默认True)
+            callbacks: 按串口名指定的回调函数 (可选，优先于配置中的callback)
+            baudrate, keywords, regex_patterns, callback, save_all_to_log,
+            callback_throttle_ms, enable_color: 所有串口共用的参数（仅限关键字
+                传入，含义同add_monitor），配置中未指定的项使用此处的值
+                (如 enable_color=False)，无需为每个配置复制字典；为None时使用默认值
         
         Returns:
             Dict[str, bool]: 每个串口的启动结果
         """
+        common = {
+            key: value for key, value in (
+                ('baudrate', baudrate),
+                ('keywords', keywords),
+                ('regex_patterns', regex_patterns),
+                ('callback', callback),
+                ('save_all_to_log', save_all_to_log),
+                ('callback_throttle_ms', callback_throttle_ms),
+                ('enable_color', enable_color),
+            ) if value is not None
+        }
         results = {}
         threads = []
         
         def start_single_monitor(config: Dict):
             port = config['port']
+            
+            def option(key, default=None):
+                return config.get(key, common.get(key, default))
+            
+            port_callback = callbacks.get(port) if callbacks else None
+            if port_callback is None:
+                port_callback = option('callback')
             try:
                 success = self.add_monitor(
                     port=port,
-                    baudrate=config.get('baudrate', 9600),
-                    keywords=config.get('keywords'),
-                    regex_patterns=config.get('regex_patterns'),
-                    callback=config.get('callback'),
-                    save_all_to_log=config.get('save_all_to_log', True),
-                    callback_throttle_ms=config.get('callback_throttle_ms', 10),
-                    enable_color=config.get('enable_color', True)
+                    baudrate=option('baudrate', 9600),
+                    keywords=option('keywords'),
+                    regex_patterns=option('regex_patterns'),
+                    callback=port_callback,
+                    save_all_to_log=option('save_all_to_log', True),
+                    callback_throttle_ms=option('callback_throttle_ms', 10),
+                    enable_color=option('enable_color', True)
                 )
                 with self.start_lock:
                     results[port] = success
@@ -473,13 +587,13 @@ class MultiSerialMonitor:
         return results
     
     def update_monitor_filters(self, port: str, keywords: Optional[List[str]] = None,
-                               regex_patterns: Optional[List[str]] = None) -> bool:
+                               regex_patterns: Optional[List[Union[str, re.Pattern]]] = None) -> bool:
         """更新指定串口的过滤条件，无需重启串口
         
         Args:
             port: 串口名称
             keywords: 新的关键词列表
-            regex_patterns: 新的正则表达式列表（字符串）
+            regex_patterns: 新的正则表达式列表（字符串或已编译的re.Pattern）
         
         Returns:
             bool: 更新是否成功
@@ -489,6 +603,37 @@ class MultiSerialMonitor:
             return True
         return False
     
+    def update_all_filters(self, keywords: Optional[List[str]] = None,
+                           regex_patterns: Optional[List[Union[str, re.Pattern]]] = None) -> List[str]:
+        """一次性更新所有活动串口的过滤条件
+        
+        同时给出关键词和正则时，合并后的过滤正则只编译一次，由所有串口共享；
+        只更新其中一项时各串口的另一项可能不同，仍按串口分别合并。
+        
+        Args:
+            keywords: 新的关键词列表
+            regex_patterns: 新的正则表达式列表（字符串或已编译的re.Pattern）
+        
+        Returns:
+            List[str]: 已更新的串口列表
+        """
+        if regex_patterns is not None:
+            regex_patterns = _compile_patterns(regex_patterns)
+        
+        shared = keywords is not None and regex_patterns is not None
+        if shared:
+            filter_search = _build_filter_search(keywords, regex_patterns)
+        
+        updated = []
+        for port, monitor in list(self.monitors.items()):
+            # 每个串口持有自己的列表副本，调用方之后修改列表不会影响串口
+            if shared:
+                monitor._set_filters(list(keywords), list(regex_patterns), filter_search)
+            else:
+                monitor.update_filters(keywords, regex_patterns)
+            updated.append(port)
+        return updated
+    
     def remove_monitor(self, port: str) -> bool:
         """移除串口监控"""
         if port in self.monitors:
@@ -513,6 +658,16 @@ class MultiSerialMonitor:
         """获取活动串口列表"""
         return list(self.monitors.keys())
     
+    def get_stats_version(self) -> tuple:
+        """获取统计版本号（各串口及其接收字节数），不变时说明统计信息没有变化
+        
+        只读取计数器，不加锁也不构造统计字典，适合界面高频轮询
+        """
+        return tuple(
+            (port, monitor.total_bytes_received)
+            for port, monitor in self.monitors.items()
+        )
+    
     def get_all_stats(self) -> Dict[str, Dict]:
         """获取所有串口的统计信息"""
         stats = {}
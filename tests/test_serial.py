@@ -5,7 +5,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-from serial_monitor import SerialMonitor, MultiSerialMonitor
+from serial_monitor import SerialMonitor, MultiSerialMonitor, re2
 import threading
 import time
 
@@ -74,6 +74,184 @@ class TestSerialMonitor(unittest.TestCase):
         self.assertTrue(monitor._matches_filter("Date: 2025-10-21"))
         self.assertFalse(monitor._matches_filter("Normal message"))
 
+    def test_matches_filter_fused_pattern(self):
+        """测试关键词和正则合并为单个正则匹配"""
+        monitor = SerialMonitor(
+            port=self.test_port,
+            keywords=["a.b", "ERROR"],
+            regex_patterns=[r"Temp:\s*\d+", r"0x[0-9A-F]+"]
+        )
+        
+        self.assertIsNotNone(monitor._filter_search)
+        self.assertTrue(monitor._matches_filter("value a.b"))
+        self.assertFalse(monitor._matches_filter("value axb"))  # 关键词按字面匹配
+        self.assertTrue(monitor._matches_filter("Temp: 30"))
+        self.assertTrue(monitor._matches_filter("ERROR"))
+        self.assertFalse(monitor._matches_filter("Normal message"))
+        
+    def test_matches_filter_unfusable_patterns(self):
+        """测试无法安全合并的正则退回逐个匹配"""
+        monitor = SerialMonitor(
+            port=self.test_port,
+            regex_patterns=[r"(x)y", r"(a)\1"]
+        )
+        
+        self.assertIsNone(monitor._filter_search)
+        self.assertTrue(monitor._matches_filter("aa"))
+        self.assertFalse(monitor._matches_filter("ax"))
+        
+        monitor.update_filters(regex_patterns=[r"(?i)error", r"warn"])
+        self.assertIsNone(monitor._filter_search)
+        self.assertTrue(monitor._matches_filter("Error"))
+        self.assertTrue(monitor._matches_filter("warn"))
+        
+    def test_fused_pattern_prefers_re2(self):
+        """测试安装re2时合并正则交给RE2，不支持的语法退回re"""
+        import re
+        import serial_monitor
+        fake_re2 = Mock()
+        fake_re2.compile.side_effect = re.compile
+        with patch.object(serial_monitor, 're2', fake_re2):
+            monitor = SerialMonitor(port=self.test_port, keywords=["ERROR"])
+            self.assertEqual(fake_re2.compile.call_count, 1)
+            self.assertTrue(monitor._matches_filter("ERROR: failed"))
+            
+            fake_re2.compile.side_effect = ValueError("unsupported")
+            monitor.update_filters(regex_patterns=[r"(a)\1"])
+            self.assertIsNotNone(monitor._filter_search)
+            self.assertTrue(monitor._matches_filter("aa"))
+            self.assertFalse(monitor._matches_filter("ab"))
+        
+    def test_fused_pattern_unicode_escapes_skip_re2(self):
+        """测试含\\w等转义的正则不交给只按ASCII匹配的RE2"""
+        import re
+        import serial_monitor
+        fake_re2 = Mock()
+        # 模拟RE2：\w、\d只匹配ASCII
+        fake_re2.compile.side_effect = lambda pattern: re.compile(pattern, re.ASCII)
+        with patch.object(serial_monitor, 're2', fake_re2):
+            monitor = SerialMonitor(port=self.test_port, regex_patterns=[r"错误\w+"])
+            fake_re2.compile.assert_not_called()
+            self.assertTrue(monitor._matches_filter("错误信息"))
+        
+            monitor.update_filters(regex_patterns=[r"错误码:[0-9]+"])
+            self.assertEqual(fake_re2.compile.call_count, 1)
+            self.assertTrue(monitor._matches_filter("错误码:42"))
+        
+    @unittest.skipUnless(re2, "未安装google-re2")
+    def test_fused_pattern_matches_re_on_non_ascii(self):
+        """测试安装RE2时，非ASCII数据的匹配结果与标准库re一致"""
+        import re
+        patterns = [r"错误\w+", r"\d+", r"\s", r"\bx", r"错误.", r"温度[:：]\s*\d+"]
+        lines = ["错误信息", "１２３", "　", "éx", "错误码", "温度：２５", "normal"]
+        for pattern in patterns:
+            monitor = SerialMonitor(port=self.test_port, regex_patterns=[pattern])
+            for line in lines:
+                self.assertEqual(
+                    monitor._matches_filter(line),
+                    re.search(pattern, line) is not None,
+                    f"{pattern!r} / {line!r}"
+                )
+        
+    def test_precompiled_patterns(self):
+        """测试直接传入已编译的正则表达式"""
+        import re
+        pattern = re.compile(r"0x[0-9A-F]+")
+        monitor = SerialMonitor(
+            port=self.test_port,
+            regex_patterns=[pattern, r"Temp:\s*\d+"]
+        )
+        
+        self.assertIs(monitor.regex_patterns[0], pattern)
+        self.assertTrue(monitor._matches_filter("Data: 0xABCD"))
+        self.assertTrue(monitor._matches_filter("Temp: 30"))
+        
+        monitor.update_filters(regex_patterns=[re.compile(r"error", re.IGNORECASE)])
+        self.assertTrue(monitor._matches_filter("ERROR: failed"))
+        self.assertFalse(monitor._matches_filter("Temp: 30"))
+        
+    def test_read_loop_batches_lines(self):
+        """测试读取循环按块分割多行、保留半行并批量写日志"""
+        received = []
+        monitor = SerialMonitor(
+            port=self.test_port,
+            log_dir="test_logs",
+            callback=lambda port, timestamp, data, colored="": received.append(data)
+        )
+        chunks = [b"line1\nline2\nhal", b"f\n"]
+        
+        def read(size):
+            chunk = chunks.pop(0)
+            if not chunks:
+                monitor.is_running = False
+            return chunk
+        
+        monitor.serial_conn = MagicMock()
+        monitor.serial_conn.in_waiting = 1
+        monitor.serial_conn.read.side_effect = read
+        monitor.is_running = True
+        
+        with patch.object(monitor, '_write_log') as mock_write_log:
+            monitor._read_loop()
+        
+        self.assertEqual(received, ["line1", "line2", "half"])
+        # 每次读取只写一次日志文件
+        self.assertEqual(mock_write_log.call_count, 2)
+        self.assertEqual(mock_write_log.call_args_list[0][0][0].count("\n"), 1)
+        self.assertEqual(monitor.get_stats()["total_bytes"], 17)
+        
+    def _run_read_loop_once(self, monitor, chunk):
+        """用模拟串口执行一次读取，返回写入日志的内容"""
+        def read(size):
+            monitor.is_running = False
+            return chunk
+        
+        monitor.serial_conn = MagicMock()
+        monitor.serial_conn.in_waiting = 1
+        monitor.serial_conn.read.side_effect = read
+        monitor.is_running = True
+        
+        with patch.object(monitor, '_write_log') as mock_write_log:
+            monitor._read_loop()
+        return [call[0][0] for call in mock_write_log.call_args_list]
+        
+    def test_read_loop_continues_after_callback_error(self):
+        """测试回调在第2行出错时，第3行仍写入日志并显示"""
+        received = []
+        
+        def callback(port, timestamp, data, colored=""):
+            received.append(data)
+            if data == "line2":
+                raise RuntimeError("callback failed")
+        
+        monitor = SerialMonitor(port=self.test_port, log_dir="test_logs", callback=callback)
+        written = self._run_read_loop_once(monitor, b"line1\nline2\nline3\n")
+        
+        self.assertEqual(received, ["line1", "line2", "line3"])
+        self.assertEqual(len(written), 1)
+        self.assertIn("line3", written[0])
+        
+    def test_read_loop_continues_after_format_error(self):
+        """测试处理第2行出错时，其余行照常记录和显示，错误写入日志"""
+        monitor = SerialMonitor(port=self.test_port, log_dir="test_logs")
+        
+        def format_output(timestamp, data):
+            if data == "line2":
+                raise RuntimeError("format failed")
+            return data
+        
+        with patch.object(monitor, '_format_colored_output', side_effect=format_output):
+            written = self._run_read_loop_once(monitor, b"line1\nline2\nline3\n")
+        
+        self.assertEqual(len(written), 1)
+        log_lines = written[0].split("\n")
+        self.assertEqual(len(log_lines), 4)
+        self.assertIn("line1", log_lines[0])
+        self.assertIn("line2", log_lines[1])
+        self.assertIn("format failed", log_lines[2])
+        self.assertIn("line3", log_lines[3])
+        queued = [monitor.data_queue.get_nowait()['data'] for _ in range(monitor.data_queue.qsize())]
+        self.assertEqual(queued, ["line1", "line3"])
 
 class TestMultiSerialMonitor(unittest.TestCase):
     """MultiSerialMonitor类测试"""
@@ -154,6 +332,85 @@ class TestMultiSerialMonitor(unittest.TestCase):
         self.assertIn("COM1", active_ports)
         self.assertIn("COM2", active_ports)
         
+    @patch('serial_monitor.SerialMonitor.start')
+    def test_update_all_filters(self, mock_start):
+        """测试一次性更新所有串口的过滤条件"""
+        mock_start.return_value = True
+        
+        self.monitor.add_monitor(port="COM1")
+        self.monitor.add_monitor(port="COM2", keywords=["OLD"])
+        
+        updated = self.monitor.update_all_filters([], [r"Temp:\s*\d+"])
+        
+        self.assertEqual(sorted(updated), ["COM1", "COM2"])
+        com1 = self.monitor.monitors["COM1"]
+        com2 = self.monitor.monitors["COM2"]
+        # 所有串口共享同一个编译后的正则对象
+        self.assertIs(com1.regex_patterns[0], com2.regex_patterns[0])
+        self.assertTrue(com2._matches_filter("Temp: 30"))
+        self.assertFalse(com2._matches_filter("OLD value"))
+        # 合并后的过滤正则只构建一次，由所有串口共享
+        self.assertIs(com1._filter_search, com2._filter_search)
+        
+        # 调用方之后修改关键词列表不影响各串口
+        keywords = ["NEW"]
+        self.monitor.update_all_filters(keywords, [])
+        keywords.append("LEAK")
+        self.assertEqual(com1.keywords, ["NEW"])
+        self.assertIsNot(com1.keywords, com2.keywords)
+        self.assertFalse(com2._matches_filter("LEAK"))
+        
+    @patch('serial_monitor.SerialMonitor.start')
+    def test_add_monitors_parallel_common_options(self, mock_start):
+        """测试并行添加时共用参数和按串口指定的回调"""
+        mock_start.return_value = True
+        callback = Mock()
+        configs = [
+            {"port": "COM1", "baudrate": 115200},
+            {"port": "COM2", "enable_color": True},
+        ]
+        
+        results = self.monitor.add_monitors_parallel(
+            configs, callbacks={"COM1": callback}, enable_color=False
+        )
+        
+        self.assertEqual(results, {"COM1": True, "COM2": True})
+        self.assertEqual(configs[0], {"port": "COM1", "baudrate": 115200})
+        com1 = self.monitor.monitors["COM1"]
+        com2 = self.monitor.monitors["COM2"]
+        self.assertIs(com1.callback, callback)
+        self.assertEqual(com1.baudrate, 115200)
+        self.assertFalse(com1.enable_color)
+        # 配置中指定的值优先于共用参数
+        self.assertTrue(com2.enable_color)
+        self.assertIsNone(com2.callback)
+        
+    @patch('serial_monitor.SerialMonitor.start')
+    def test_add_monitors_parallel_rejects_unknown_option(self, mock_start):
+        """测试并行添加时拼写错误的共用参数会报错"""
+        mock_start.return_value = True
+        
+        with self.assertRaises(TypeError):
+            self.monitor.add_monitors_parallel(
+                [{"port": "COM1"}], enable_colour=False
+            )
+        self.assertEqual(self.monitor.monitors, {})
+        mock_start.assert_not_called()
+        
+    @patch('serial_monitor.SerialMonitor.start')
+    def test_get_stats_version(self, mock_start):
+        """测试统计版本号随串口列表和接收字节数变化"""
+        mock_start.return_value = True
+        
+        empty = self.monitor.get_stats_version()
+        self.monitor.add_monitor(port="COM1")
+        added = self.monitor.get_stats_version()
+        self.assertNotEqual(empty, added)
+        self.assertEqual(added, self.monitor.get_stats_version())
+        
+        self.monitor.monitors["COM1"].total_bytes_received += 10
+        self.assertNotEqual(added, self.monitor.get_stats_version())
+    
     @patch('serial.tools.list_ports.comports')
     def test_list_available_ports(self, mock_comports):
         """测试列出可用串口"""